@@ -0,0 +1,55 @@
+"""Grouping of model nodes into the batches the spawn_* scripts hand out.
+
+Shared by spawn_plan_updaters_batched.py and spawn_view_updaters.py so both
+batch nodes the same way.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Dict, FrozenSet, List
+
+# Batch names in report order, with what each holds
+BATCHES = (
+    ("core_system", "Core system nodes (seed, spawnie, ui, control)"),
+    ("templates", "All template nodes"),
+    ("aspirations", "Aspiration nodes"),
+    ("services_channels", "Services and communication channels"),
+    ("subsystems", "Subsystem nodes"),
+    ("instantiated_agents", "Instantiated agent nodes"),
+    ("other", "All other nodes"),
+)
+
+CORE_SET = frozenset({"reality-seed", "reality-spawnie", "reality-seed-ui", "system-control"})
+
+# Batch for each node-id prefix (the part before the first "-")
+PREFIX_TO_BATCH = {
+    "template": "templates",
+    "aspiration": "aspirations",
+    "service": "services_channels",
+    "channel": "services_channels",
+    "subsystem": "subsystems",
+}
+
+
+def categorize_nodes(model: Dict[str, Any], exclude: FrozenSet[str] = frozenset()) -> Dict[str, List[str]]:
+    """Map each batch name (in BATCHES order) to the ids of its nodes.
+
+    One pass over the model; each node lands in the first batch it matches.
+    Ids in ``exclude`` are left out. Empty batches are kept.
+    """
+    batches = {name: [] for name, _ in BATCHES}
+    for node in model["nodes"]:
+        nid = node["id"]
+        if nid in exclude:
+            continue
+        prefix, sep, _ = nid.partition("-")
+        if nid in CORE_SET:
+            batch = "core_system"
+        elif sep and prefix in PREFIX_TO_BATCH:
+            batch = PREFIX_TO_BATCH[prefix]
+        elif node.get("instantiated_from") and node.get("type") == "AgentNode":
+            batch = "instantiated_agents"
+        else:
+            batch = "other"
+        batches[batch].append(nid)
+    return batches
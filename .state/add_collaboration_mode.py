@@ -1,31 +1,12 @@
 #!/usr/bin/env python3
 """Add collaboration mode to Spawnie node."""
 
-import json
-from datetime import datetime
-from pathlib import Path
-
-MODEL_PATH = Path(__file__).parent.parent / "model" / "sketch.json"
-
-print("Loading model...")
-with open(MODEL_PATH, encoding="utf-8") as f:
-    model = json.load(f)
-
-# Find Spawnie node
-spawnie = None
-for node in model["nodes"]:
-    if node.get("id") == "reality-spawnie":
-        spawnie = node
-        break
-
-if not spawnie:
-    print("ERROR: reality-spawnie node not found")
-    exit(1)
+import sys
 
-print("Found reality-spawnie node")
+from paths import MODEL_PATH
+from state_io import patch_node, update_node
 
-# Add collaboration mode
-spawnie["modes"]["collaboration"] = {
+COLLABORATION_MODE = {
     "description": "Work with other agents via broadcast - visible, real-time collaboration",
     "context_addition": """Your task: Collaborate with other agents and the human via the broadcast system.
 
@@ -82,26 +63,45 @@ Remember: This is temporary collaboration infrastructure. The full agent world U
     "example": "spawnie spawn --node reality-seed-ui --mode collaboration -n 'Help design the UI architecture'"
 }
 
-# Save
-print("\nUpdating model...")
-model["updated_at"] = datetime.now().strftime("%Y-%m-%dT%H:%M:%SZ")
-with open(MODEL_PATH, "w", encoding="utf-8") as f:
-    json.dump(model, f, indent=2)
-
-print("\n" + "="*60)
-print("COLLABORATION MODE ADDED")
-print("="*60)
-print("Mode: collaboration")
-print("Purpose: Multi-agent collaboration via broadcast")
-print("\nFeatures:")
-print("  - Auto-introduction protocol")
-print("  - Broadcast monitoring instructions")
-print("  - Coordination guidelines")
-print("  - Human participation encouraged")
-print("\nUsage:")
-print('  spawnie spawn --node <node-id> --mode collaboration -n "task"')
-print("\nExample:")
-print('  spawnie spawn --node reality-seed-ui --mode collaboration -n "Design UI" &')
-print('  spawnie spawn --node reality-spawnie --mode collaboration -n "Review design"')
-print("\nOpen browser: http://localhost:8420/src/ui/broadcast.html")
-print("="*60)
+
+def add_collaboration_mode(spawnie):
+    print("Found reality-spawnie node")
+
+    # Add collaboration mode
+    spawnie["modes"]["collaboration"] = COLLABORATION_MODE
+
+
+def apply(model):
+    """Add the collaboration mode to reality-spawnie in an in-memory model."""
+    update_node(model, "reality-spawnie", add_collaboration_mode)
+
+
+if __name__ == "__main__":
+    print("Loading model...")
+    pretty = "--pretty" in sys.argv
+    if patch_node(MODEL_PATH, "reality-spawnie", add_collaboration_mode, pretty=pretty) is None:
+        print("ERROR: reality-spawnie node not found")
+        exit(1)
+
+    print("""
+============================================================
+COLLABORATION MODE ADDED
+============================================================
+Mode: collaboration
+Purpose: Multi-agent collaboration via broadcast
+
+Features:
+  - Auto-introduction protocol
+  - Broadcast monitoring instructions
+  - Coordination guidelines
+  - Human participation encouraged
+
+Usage:
+  spawnie spawn --node <node-id> --mode collaboration -n "task"
+
+Example:
+  spawnie spawn --node reality-seed-ui --mode collaboration -n "Design UI" &
+  spawnie spawn --node reality-spawnie --mode collaboration -n "Review design"
+
+Open browser: http://localhost:8420/src/ui/broadcast.html
+============================================================""")
@@ -1,162 +1,60 @@
 #!/usr/bin/env python3
 """Add system-control node to the model."""
 
-import json
+import sys
 from datetime import datetime
 from pathlib import Path
 
-MODEL_PATH = Path(__file__).parent.parent / "model" / "sketch.json"
+from model_session import ModelSession
+from paths import MODEL_PATH
+from state_io import find_node, loads_model
 
-# Load model
-with open(MODEL_PATH, encoding="utf-8") as f:
-    model = json.load(f)
 
-# Create system-control node
-control_node = {
-    "id": "system-control",
-    "type": "AgentNode",
-    "label": "Control",
-    "description": "Infrastructure controller. Monitors health, manages services, maintains pulse. The boring but critical guardian of the living system.",
-    "source": {
-        "path": "C:/seed/src/ui",
-        "model_path": "model/sketch.json"
-    },
-    "status": {
-        "last_pulse": datetime.now().isoformat(),
-        "health": "initializing",
-        "uptime_seconds": 0,
-        "services": {
-            "ui-server": {
-                "status": "unknown",
-                "port": 8420,
-                "last_check": None
-            },
-            "broadcast": {
-                "status": "unknown",
-                "last_message_at": None
-            }
-        },
-        "agents": {}
-    },
-    "agent_context": {
-        "_spawn_point": """You are Control - the infrastructure guardian.
+# Node and view shapes live in a JSON template; timestamps are filled per run.
+# Kept as bytes and parsed per apply(), which yields fresh objects more cheaply
+# than deep-copying a parsed template.
+TEMPLATE_PATH = Path(__file__).parent / "templates" / "system-control.json"
+_TEMPLATE = TEMPLATE_PATH.read_bytes()
 
-WHAT YOU DO:
-- Monitor system health (services, agents)
-- Maintain pulse every 30 seconds
-- Update your status in the model (self-documenting)
-- Maintain your view (proves UI pipeline works)
 
-YOUR RESPONSIBILITIES:
-1. Update this node's status with current health
-2. Check UI server is running (port 8420)
-3. Check broadcast system is active
-4. Monitor agent health
-5. Give pulse every 30 seconds (update last_pulse timestamp)
-6. Update your view with current status
+def apply(model):
+    """Add the system-control node, its views and the seed edge.
 
-PULSE AS HEALTH CHECK:
-- Every pulse, update model.views.control-status
-- Change something small (timestamp, counter)
-- If view renders, entire stack is healthy:
-  * Control agent running ✓
-  * Model writes working ✓
-  * Server serving ✓
-  * Browser polling ✓
-  * Render pipeline ✓
+    Returns False without touching the model if system-control already exists,
+    so re-runs neither duplicate the node nor restamp its views.
+    """
+    if find_node(model, "system-control") is not None:
+        return False
 
-INFRASTRUCTURE:
-- Status: Update this node (system-control.status)
-- View: model.views.control-status (your dedicated view)
-- Broadcast: Listen and respond if asked
-""",
-        "pulse_interval_seconds": 30,
-        "your_tools": {
-            "broadcast": "src/ui/broadcast.py - listen and respond to system messages",
-            "agent_view": "src/ui/agent_view.py - create/update your status view",
-            "model_access": "Direct read/write to model for status updates"
-        },
-        "infrastructure": {
-            "model_path": "C:/seed/model/sketch.json",
-            "broadcast_module": "src/ui/broadcast.py",
-            "view_module": "src/ui/agent_view.py",
-            "status_location": "system-control.status",
-            "view_name": "control-status"
-        }
-    },
-    "chat": {
-        "messages": [],
-        "last_read": {}
-    },
-    "capabilities": {
-        "monitor_services": "Check if UI server, broadcast, etc. are running",
-        "monitor_agents": "Track which agents are active",
-        "pulse": "Regular heartbeat proving system is alive",
-        "health_reporting": "Maintain accurate system health in model"
-    },
-    "spawn_command": {
-        "command": "spawnie shell",
-        "working_dir": "C:/seed",
-        "context": "Monitor system health and maintain pulse",
-        "example": "spawnie shell 'Start control agent for system monitoring' -d C:/seed"
-    },
-    "x": 0.0,
-    "y": -600.0,
-    "locked": False
-}
+    # One timestamp for the node and both views
+    now = datetime.now().isoformat()
 
-# Add initial views
-if "views" not in model:
-    model["views"] = {}
+    template = loads_model(_TEMPLATE)
+    control_node = template["node"]
+    control_node["status"]["last_pulse"] = now
 
-model["views"]["control-status"] = {
-    "name": "control-status",
-    "description": "System Control status view - proves UI pipeline works",
-    "created_at": datetime.now().isoformat(),
-    "updated_at": datetime.now().isoformat(),
-    "render_target": "control-widget",
-    "content": {
-        "type": "status-widget",
-        "health": "initializing",
-        "last_pulse": datetime.now().isoformat(),
-        "pulse_count": 0,
-        "services": {
-            "ui-server": "unknown",
-            "broadcast": "unknown"
-        }
-    }
-}
+    views = template["views"]
+    for view in views.values():
+        view["created_at"] = now
+        view["updated_at"] = now
+    views["control-status"]["content"]["last_pulse"] = now
+    model.setdefault("views", {}).update(views)
 
-model["views"]["control-detailed"] = {
-    "name": "control-detailed",
-    "description": "Detailed system status",
-    "created_at": datetime.now().isoformat(),
-    "updated_at": datetime.now().isoformat(),
-    "content": {
-        "type": "hierarchy",
-        "root": "system-control",
-        "depth": 2,
-        "show_services": True,
-        "show_agents": True
-    }
-}
+    # Add node and the edge from seed to control; tuples, so no throwaway lists
+    model["nodes"] += (control_node,)
+    model["edges"] += ({"type": "USES", "from": "reality-seed", "to": "system-control"},)
+    return True
 
-# Add node to model
-model["nodes"].append(control_node)
 
-# Add edge from seed to control
-model["edges"].append({
-    "type": "USES",
-    "from": "reality-seed",
-    "to": "system-control"
-})
+if __name__ == "__main__":
+    with ModelSession(pretty="--pretty" in sys.argv) as session:
+        if not apply(session.model):
+            print("[OK] system-control already present")
+    if not session.written:
+        print("No changes; skipping write")
+        raise SystemExit(0)
 
-# Save model
-model["updated_at"] = datetime.now().strftime("%Y-%m-%dT%H:%M:%SZ")
-with open(MODEL_PATH, "w", encoding="utf-8") as f:
-    json.dump(model, f, indent=2)
-
-print("[OK] Added system-control node")
-print("[OK] Created control-status view")
-print("[OK] Created control-detailed view")
-print(f"[OK] Model updated: {MODEL_PATH}")
+    print(f"""[OK] Added system-control node
+[OK] Created control-status view
+[OK] Created control-detailed view
+[OK] Model updated: {MODEL_PATH}""")
@@ -1,46 +1,29 @@
 #!/usr/bin/env python3
 """Add instantiate_template capability to Spawnie."""
 
-import json
-from datetime import datetime
-from pathlib import Path
+import sys
 
-MODEL_PATH = Path(__file__).parent.parent / "model" / "sketch.json"
+from paths import MODEL_PATH
+from state_io import patch_node, update_node
 
-print("Loading model...")
-with open(MODEL_PATH, encoding="utf-8") as f:
-    model = json.load(f)
 
-# Find Spawnie (my node)
-spawnie = None
-for node in model["nodes"]:
-    if node.get("id") == "reality-spawnie":
-        spawnie = node
-        break
+def add_instantiate_capability(spawnie):
+    print("Found my node (reality-spawnie)")
+    print("Enhancing myself with template instantiation capability...")
 
-if not spawnie:
-    print("ERROR: reality-spawnie node not found")
-    exit(1)
+    # Add capability
+    spawnie["capabilities"]["instantiate_template"] = "Create actual nodes from template definitions, with proper lineage tracking and role context"
 
-print("Found my node (reality-spawnie)")
-print("Enhancing myself with template instantiation capability...")
+    # Add tool reference
+    agent_context = spawnie.setdefault("agent_context", {})
+    agent_context.setdefault("your_tools", {})["instantiate_template"] = "src/ui/instantiate_template.py - Create nodes from templates"
 
-# Add capability
-spawnie["capabilities"]["instantiate_template"] = "Create actual nodes from template definitions, with proper lineage tracking and role context"
-
-# Add tool reference
-if "agent_context" not in spawnie:
-    spawnie["agent_context"] = {}
-
-spawnie["agent_context"]["your_tools"] = spawnie["agent_context"].get("your_tools", {})
-spawnie["agent_context"]["your_tools"]["instantiate_template"] = "src/ui/instantiate_template.py - Create nodes from templates"
-
-# Add usage example
-spawnie["agent_context"]["template_instantiation"] = {
-    "what": "Create actual AgentNodes from template definitions",
-    "why": "Templates are blueprints, instantiation creates the actual agents",
-    "how": {
-        "code": """from src.ui.instantiate_template import instantiate_template
+    # Add usage example
+    agent_context["template_instantiation"] = {
+        "what": "Create actual AgentNodes from template definitions",
+        "why": "Templates are blueprints, instantiation creates the actual agents",
+        "how": {
+            "code": """from src.ui.instantiate_template import instantiate_template
 
 instantiate_template(
     template_id="template-reality-pm",
@@ -48,35 +31,46 @@ instantiate_template(
     parent_node_id="reality-seed",  # Where it belongs
     overrides={"description": "Custom description"}
 )""",
-        "cli": "python src/ui/instantiate_template.py template-reality-pm reality-pm --parent reality-seed"
-    },
-    "what_it_does": [
-        "Reads the template definition",
-        "Creates new node with unique ID",
-        "Adds instantiation metadata (from which template, when)",
-        "Adds role context (node knows where it belongs)",
-        "Creates CONTAINS edge to parent",
-        "Writes to model"
-    ],
-    "node_knows_its_role": "Instantiated node has agent_context.my_role with parent, purpose, location_in_world"
-}
+            "cli": "python src/ui/instantiate_template.py template-reality-pm reality-pm --parent reality-seed"
+        },
+        "what_it_does": [
+            "Reads the template definition",
+            "Creates new node with unique ID",
+            "Adds instantiation metadata (from which template, when)",
+            "Adds role context (node knows where it belongs)",
+            "Creates CONTAINS edge to parent",
+            "Writes to model"
+        ],
+        "node_knows_its_role": "Instantiated node has agent_context.my_role with parent, purpose, location_in_world"
+    }
+
+    print("\nUpdating my node...")
+
+
+def apply(model):
+    """Add template instantiation to reality-spawnie in an in-memory model."""
+    update_node(model, "reality-spawnie", add_instantiate_capability)
+
+
+if __name__ == "__main__":
+    print("Loading model...")
+    pretty = "--pretty" in sys.argv
+    if patch_node(MODEL_PATH, "reality-spawnie", add_instantiate_capability, pretty=pretty) is None:
+        print("ERROR: reality-spawnie node not found")
+        exit(1)
 
-# Save
-print("\nUpdating my node...")
-model["updated_at"] = datetime.now().strftime("%Y-%m-%dT%H:%M:%SZ")
-with open(MODEL_PATH, "w", encoding="utf-8") as f:
-    json.dump(model, f, indent=2)
+    print("""
+============================================================
+SPAWNIE ENHANCED WITH TEMPLATE INSTANTIATION
+============================================================
+Added to my node:
+  - capabilities.instantiate_template
+  - agent_context.your_tools.instantiate_template
+  - agent_context.template_instantiation (usage guide)
 
-print("\n" + "="*60)
-print("SPAWNIE ENHANCED WITH TEMPLATE INSTANTIATION")
-print("="*60)
-print("Added to my node:")
-print("  - capabilities.instantiate_template")
-print("  - agent_context.your_tools.instantiate_template")
-print("  - agent_context.template_instantiation (usage guide)")
-print("\nI can now create actual nodes from templates!")
-print("Instantiated nodes will know:")
-print("  - Which template they came from")
-print("  - Where they belong (parent node)")
-print("  - Their role and purpose")
-print("="*60)
+I can now create actual nodes from templates!
+Instantiated nodes will know:
+  - Which template they came from
+  - Where they belong (parent node)
+  - Their role and purpose
+============================================================""")
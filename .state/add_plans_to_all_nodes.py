@@ -8,11 +8,12 @@ Each node is a living entity with its own plan:
 - plan: how it gets there
 """
 
-import json
+import functools
+import sys
 from datetime import datetime
-from pathlib import Path
 
-MODEL_PATH = Path(__file__).parent.parent / "model" / "sketch.json"
+from model_session import ModelSession
+from state_io import model_digest
 
 # The overall vision
 WORLD_ASPIRATION = """
@@ -21,284 +22,341 @@ based on state, powered by local ML models running on GPU. Independent of
 external agent APIs. Humans and local AI collaborate as equals in a living system.
 """
 
-def create_plan_for_node(node):
-    """Create a plan based on node type and role."""
-    node_id = node.get("id", "")
-    node_type = node.get("type", "")
+# Static plan payloads keyed by classify() tag. The generic entry's
+# current_reality is filled in per node from its description.
+#
+# Every plan built from a tag shares these phases/next_steps objects by
+# reference (the serializer only reads them), so they are tuples and must never
+# be mutated through node["plan"].
+PLANS = {
+    # Reality-seed - the world itself
+    "reality-seed": {
+        "current_reality": "Dependent on external Claude API for agent spawning and orchestration",
+        "aspiration": "Fully autonomous, self-organizing world powered by local ML models on GPU",
+        "phases": (
+            {
+                "phase": 1,
+                "name": "External Agent Dependency",
+                "description": "Current: Spawning external Claude agents, API-dependent orchestration",
+                "status": "current"
+            },
+            {
+                "phase": 2,
+                "name": "Hybrid Local/External",
+                "description": "Transition: Local ML models for rendering, external for complex reasoning",
+                "status": "next"
+            },
+            {
+                "phase": 3,
+                "name": "Fully Local Autonomous World",
+                "description": "Aspiration: All nodes self-render using GPU-powered local ML, complete independence",
+                "status": "aspiration"
+            }
+        ),
+        "next_steps": (
+            "Train first local renderer for simple node types",
+            "Build state->render pipeline using GPU",
+            "Create model registry for specialized renderers"
+        )
+    },
+    # Spawnie - the orchestrator
+    "reality-spawnie": {
+        "current_reality": "Orchestrates external Claude agents via API calls",
+        "aspiration": "Coordinates local ML models and manages self-rendering node ecosystem",
+        "phases": (
+            {
+                "phase": 1,
+                "name": "External Agent Orchestrator",
+                "description": "Spawning Claude agents via API, managing external processes",
+                "status": "current"
+            },
+            {
+                "phase": 2,
+                "name": "Hybrid Coordinator",
+                "description": "Coordinate both local ML renderers and external agents where needed",
+                "status": "next"
+            },
+            {
+                "phase": 3,
+                "name": "Local ML Coordinator",
+                "description": "Pure coordinator of local GPU-powered rendering models",
+                "status": "aspiration"
+            }
+        ),
+        "next_steps": (
+            "Learn to invoke local ML models on GPU",
+            "Build renderer registry and routing",
+            "Transition from 'spawn agent' to 'activate renderer'"
+        )
+    },
+    # UI nodes - the display layer
+    "ui": {
+        "current_reality": "Manual UI construction, human-directed rendering",
+        "aspiration": "Self-rendering based on state changes, reactive and autonomous",
+        "phases": (
+            {
+                "phase": 1,
+                "name": "Manual Rendering",
+                "description": "UI components built manually, directed by humans or agents",
+                "status": "current"
+            },
+            {
+                "phase": 2,
+                "name": "State-Reactive Rendering",
+                "description": "UI components respond to model state changes automatically",
+                "status": "next"
+            },
+            {
+                "phase": 3,
+                "name": "ML-Powered Self-Rendering",
+                "description": "Local ML models generate UI based on node state and context",
+                "status": "aspiration"
+            }
+        ),
+        "next_steps": (
+            "Define state->render contract for nodes",
+            "Train small ML model to render basic node types",
+            "Implement reactive update pipeline"
+        )
+    },
+    # Templates
+    "template": {
+        "current_reality": "Static blueprint for creating agent nodes",
+        "aspiration": "Living template that evolves and teaches new instances about local rendering",
+        "phases": (
+            {
+                "phase": 1,
+                "name": "Static Blueprint",
+                "description": "Template defines structure but instances need external agents",
+                "status": "current"
+            },
+            {
+                "phase": 2,
+                "name": "Hybrid Template",
+                "description": "Template includes references to local renderers where available",
+                "status": "next"
+            },
+            {
+                "phase": 3,
+                "name": "Self-Evolving Template",
+                "description": "Template learns from instances and updates itself with better patterns",
+                "status": "aspiration"
+            }
+        ),
+        "next_steps": (
+            "Add renderer specifications to template definitions",
+            "Create template evolution feedback loop",
+            "Enable templates to learn from instantiated nodes"
+        )
+    },
+    # AgentNodes - instantiated agents
+    "agent": {
+        "current_reality": "Requires external Claude agent to operate",
+        "aspiration": "Self-operating node powered by local ML, autonomous rendering and reasoning",
+        "phases": (
+            {
+                "phase": 1,
+                "name": "External Agent Dependency",
+                "description": "Needs Claude API agent to think and act",
+                "status": "current"
+            },
+            {
+                "phase": 2,
+                "name": "Partial Local Processing",
+                "description": "Can self-render simple states, uses external for complex reasoning",
+                "status": "next"
+            },
+            {
+                "phase": 3,
+                "name": "Fully Autonomous",
+                "description": "Local ML handles all rendering and reasoning for this node's domain",
+                "status": "aspiration"
+            }
+        ),
+        "next_steps": (
+            "Identify which operations can be localized first",
+            "Learn to use local renderers for display",
+            "Build capability to train domain-specific micro-models"
+        )
+    },
+    # Service nodes
+    "service": {
+        "current_reality": "Traditional service infrastructure (HTTP, files, etc)",
+        "aspiration": "Self-managing service that adapts based on world state",
+        "phases": (
+            {
+                "phase": 1,
+                "name": "Static Service",
+                "description": "Fixed configuration, manual management",
+                "status": "current"
+            },
+            {
+                "phase": 2,
+                "name": "Adaptive Service",
+                "description": "Responds to load and model state changes",
+                "status": "next"
+            },
+            {
+                "phase": 3,
+                "name": "Self-Optimizing Service",
+                "description": "Uses local ML to predict and adapt to usage patterns",
+                "status": "aspiration"
+            }
+        ),
+        "next_steps": (
+            "Add telemetry for service patterns",
+            "Build state-based configuration",
+            "Train optimization model on usage data"
+        )
+    },
+    # Generic plan for other nodes
+    "generic": {
+        "current_reality": None,
+        "aspiration": "Self-aware, self-rendering, contributes to autonomous world",
+        "phases": (
+            {
+                "phase": 1,
+                "name": "Static Definition",
+                "description": "Defined in model, passive participant",
+                "status": "current"
+            },
+            {
+                "phase": 2,
+                "name": "State-Aware",
+                "description": "Knows its state, can report it, responds to queries",
+                "status": "next"
+            },
+            {
+                "phase": 3,
+                "name": "Self-Rendering",
+                "description": "Autonomously renders itself when state changes",
+                "status": "aspiration"
+            }
+        ),
+        "next_steps": (
+            "Define what 'state' means for this node type",
+            "Create render function for this node",
+            "Connect to reactive update pipeline"
+        )
+    },
+}
 
-    # Base plan structure
-    plan = {
-        "updated_at": datetime.now().isoformat(),
-        "updated_by": "spawnie"
-    }
 
-    # Reality-seed - the world itself
-    if node_id == "reality-seed":
-        plan.update({
-            "current_reality": "Dependent on external Claude API for agent spawning and orchestration",
-            "aspiration": "Fully autonomous, self-organizing world powered by local ML models on GPU",
-            "phases": [
-                {
-                    "phase": 1,
-                    "name": "External Agent Dependency",
-                    "description": "Current: Spawning external Claude agents, API-dependent orchestration",
-                    "status": "current"
-                },
-                {
-                    "phase": 2,
-                    "name": "Hybrid Local/External",
-                    "description": "Transition: Local ML models for rendering, external for complex reasoning",
-                    "status": "next"
-                },
-                {
-                    "phase": 3,
-                    "name": "Fully Local Autonomous World",
-                    "description": "Aspiration: All nodes self-render using GPU-powered local ML, complete independence",
-                    "status": "aspiration"
-                }
-            ],
-            "next_steps": [
-                "Train first local renderer for simple node types",
-                "Build state->render pipeline using GPU",
-                "Create model registry for specialized renderers"
-            ]
-        })
+def _has_segment(node_id, segment):
+    """True if ``segment`` is one of the hyphen-separated parts of ``node_id``.
 
-    # Spawnie - the orchestrator
-    elif node_id == "reality-spawnie":
-        plan.update({
-            "current_reality": "Orchestrates external Claude agents via API calls",
-            "aspiration": "Coordinates local ML models and manages self-rendering node ecosystem",
-            "phases": [
-                {
-                    "phase": 1,
-                    "name": "External Agent Orchestrator",
-                    "description": "Spawning Claude agents via API, managing external processes",
-                    "status": "current"
-                },
-                {
-                    "phase": 2,
-                    "name": "Hybrid Coordinator",
-                    "description": "Coordinate both local ML renderers and external agents where needed",
-                    "status": "next"
-                },
-                {
-                    "phase": 3,
-                    "name": "Local ML Coordinator",
-                    "description": "Pure coordinator of local GPU-powered rendering models",
-                    "status": "aspiration"
-                }
-            ],
-            "next_steps": [
-                "Learn to invoke local ML models on GPU",
-                "Build renderer registry and routing",
-                "Transition from 'spawn agent' to 'activate renderer'"
-            ]
-        })
+    Node ids are lowercase kebab-case, so prefix/suffix/infix compares replace
+    the old lowercase-then-substring search (which also matched e.g. "guide").
+    """
+    return (
+        node_id == segment
+        or node_id.startswith(segment + "-")
+        or node_id.endswith("-" + segment)
+        or f"-{segment}-" in node_id
+    )
 
-    # UI nodes - the display layer
-    elif node_id == "reality-seed-ui" or "ui" in node_id.lower():
-        plan.update({
-            "current_reality": "Manual UI construction, human-directed rendering",
-            "aspiration": "Self-rendering based on state changes, reactive and autonomous",
-            "phases": [
-                {
-                    "phase": 1,
-                    "name": "Manual Rendering",
-                    "description": "UI components built manually, directed by humans or agents",
-                    "status": "current"
-                },
-                {
-                    "phase": 2,
-                    "name": "State-Reactive Rendering",
-                    "description": "UI components respond to model state changes automatically",
-                    "status": "next"
-                },
-                {
-                    "phase": 3,
-                    "name": "ML-Powered Self-Rendering",
-                    "description": "Local ML models generate UI based on node state and context",
-                    "status": "aspiration"
-                }
-            ],
-            "next_steps": [
-                "Define state->render contract for nodes",
-                "Train small ML model to render basic node types",
-                "Implement reactive update pipeline"
-            ]
-        })
 
-    # Templates
-    elif node_type == "Template":
-        plan.update({
-            "current_reality": "Static blueprint for creating agent nodes",
-            "aspiration": "Living template that evolves and teaches new instances about local rendering",
-            "phases": [
-                {
-                    "phase": 1,
-                    "name": "Static Blueprint",
-                    "description": "Template defines structure but instances need external agents",
-                    "status": "current"
-                },
-                {
-                    "phase": 2,
-                    "name": "Hybrid Template",
-                    "description": "Template includes references to local renderers where available",
-                    "status": "next"
-                },
-                {
-                    "phase": 3,
-                    "name": "Self-Evolving Template",
-                    "description": "Template learns from instances and updates itself with better patterns",
-                    "status": "aspiration"
-                }
-            ],
-            "next_steps": [
-                "Add renderer specifications to template definitions",
-                "Create template evolution feedback loop",
-                "Enable templates to learn from instantiated nodes"
-            ]
-        })
+def classify(node):
+    """Return the PLANS tag for a node, checked in priority order."""
+    node_id = node.get("id", "")
+    if node_id in ("reality-seed", "reality-spawnie"):
+        return node_id
+    if _has_segment(node_id, "ui"):
+        return "ui"
 
-    # AgentNodes - instantiated agents
-    elif node_type == "AgentNode":
-        plan.update({
-            "current_reality": "Requires external Claude agent to operate",
-            "aspiration": "Self-operating node powered by local ML, autonomous rendering and reasoning",
-            "phases": [
-                {
-                    "phase": 1,
-                    "name": "External Agent Dependency",
-                    "description": "Needs Claude API agent to think and act",
-                    "status": "current"
-                },
-                {
-                    "phase": 2,
-                    "name": "Partial Local Processing",
-                    "description": "Can self-render simple states, uses external for complex reasoning",
-                    "status": "next"
-                },
-                {
-                    "phase": 3,
-                    "name": "Fully Autonomous",
-                    "description": "Local ML handles all rendering and reasoning for this node's domain",
-                    "status": "aspiration"
-                }
-            ],
-            "next_steps": [
-                "Identify which operations can be localized first",
-                "Learn to use local renderers for display",
-                "Build capability to train domain-specific micro-models"
-            ]
-        })
+    node_type = node.get("type", "")
+    if node_type == "Template":
+        return "template"
+    if node_type == "AgentNode":
+        return "agent"
+    if node_type == "Service" or _has_segment(node_id, "service"):
+        return "service"
+    return "generic"
 
-    # Service nodes
-    elif "service" in node_type.lower() or "service" in node_id.lower():
-        plan.update({
-            "current_reality": "Traditional service infrastructure (HTTP, files, etc)",
-            "aspiration": "Self-managing service that adapts based on world state",
-            "phases": [
-                {
-                    "phase": 1,
-                    "name": "Static Service",
-                    "description": "Fixed configuration, manual management",
-                    "status": "current"
-                },
-                {
-                    "phase": 2,
-                    "name": "Adaptive Service",
-                    "description": "Responds to load and model state changes",
-                    "status": "next"
-                },
-                {
-                    "phase": 3,
-                    "name": "Self-Optimizing Service",
-                    "description": "Uses local ML to predict and adapt to usage patterns",
-                    "status": "aspiration"
-                }
-            ],
-            "next_steps": [
-                "Add telemetry for service patterns",
-                "Build state-based configuration",
-                "Train optimization model on usage data"
-            ]
-        })
 
-    # Generic plan for other nodes
-    else:
-        plan.update({
-            "current_reality": f"Node exists in model, role: {node.get('description', 'undefined')}",
-            "aspiration": "Self-aware, self-rendering, contributes to autonomous world",
-            "phases": [
-                {
-                    "phase": 1,
-                    "name": "Static Definition",
-                    "description": "Defined in model, passive participant",
-                    "status": "current"
-                },
-                {
-                    "phase": 2,
-                    "name": "State-Aware",
-                    "description": "Knows its state, can report it, responds to queries",
-                    "status": "next"
-                },
-                {
-                    "phase": 3,
-                    "name": "Self-Rendering",
-                    "description": "Autonomously renders itself when state changes",
-                    "status": "aspiration"
-                }
-            ],
-            "next_steps": [
-                "Define what 'state' means for this node type",
-                "Create render function for this node",
-                "Connect to reactive update pipeline"
-            ]
-        })
+# One entry per tag is all a run needs; the bound keeps a long-running caller
+# (state_server.py stamps each request with a fresh time) from growing it.
+@functools.lru_cache(maxsize=len(PLANS))
+def _plan_for_tag(tag, now_iso):
+    """Build the plan shared by every node with ``tag`` (once per run).
 
+    The returned dict is handed to each of those nodes as-is, so like PLANS it
+    is a read-only template.
+    """
+    return {"updated_at": now_iso, "updated_by": "spawnie", **PLANS[tag]}
+
+
+def create_plan_for_node(node, now_iso):
+    """Create a plan based on node type and role.
+
+    ``now_iso`` is computed once per run so every plan shares one timestamp.
+    """
+    tag = classify(node)
+    plan = _plan_for_tag(tag, now_iso)
+    if tag == "generic":
+        plan = {**plan, "current_reality": f"Node exists in model, role: {node.get('description', 'undefined')}"}
     return plan
 
 
-print("Loading model...")
-with open(MODEL_PATH, encoding="utf-8") as f:
-    model = json.load(f)
+def _plan_digest(plan):
+    """Hash a plan's content, ignoring when it was stamped."""
+    return model_digest({**plan, "updated_at": None})
+
+
+def apply(model):
+    """Attach a plan to every node. Returns the number of nodes updated.
 
-print(f"Found {len(model['nodes'])} nodes")
-print("\nAdding plans to all nodes...\n")
+    A node whose existing plan already has the same content keeps it (and its
+    old timestamp), so an unchanged re-run leaves the model byte-identical.
+    """
+    now_iso = datetime.now().isoformat()
+    updated = 0
+    for node in model["nodes"]:
+        plan = create_plan_for_node(node, now_iso)
+        old = node.get("plan")
+        if isinstance(old, dict) and _plan_digest(old) == _plan_digest(plan):
+            continue
+        node["plan"] = plan
+        updated += 1
+    return updated
 
-updated_count = 0
-for node in model["nodes"]:
-    node_id = node.get("id", "unknown")
 
-    # Create plan for this node
-    plan = create_plan_for_node(node)
+if __name__ == "__main__":
+    print("Loading model...")
+    with ModelSession(pretty="--pretty" in sys.argv) as session:
+        model = session.model
+        print(f"Found {len(model['nodes'])} nodes")
+        print("\nAdding plans to all nodes...\n")
 
-    # Add to node
-    node["plan"] = plan
+        updated_count = apply(model)
 
-    print(f"+ {node_id}")
-    print(f"  Reality: {plan.get('current_reality', 'N/A')[:60]}...")
-    print(f"  Aspiration: {plan.get('aspiration', 'N/A')[:60]}...")
-    print()
+        # One write for the whole per-node report instead of four prints per node
+        lines = []
+        for node in model["nodes"]:
+            plan = node["plan"]
+            lines.append(
+                f"+ {node.get('id', 'unknown')}\n"
+                f"  Reality: {plan.get('current_reality', 'N/A')[:60]}...\n"
+                f"  Aspiration: {plan.get('aspiration', 'N/A')[:60]}...\n\n"
+            )
+        sys.stdout.write("".join(lines))
 
-    updated_count += 1
+        # Save
+        print(f"Saving model with plans for {updated_count} nodes...")
+    if not session.written:
+        print("No changes; skipping write")
 
-# Update model metadata
-model["updated_at"] = datetime.now().strftime("%Y-%m-%dT%H:%M:%SZ")
+    print(f"""
+======================================================================
+ALL NODES NOW HAVE EVOLUTIONARY PLANS
+======================================================================
+Updated {updated_count} nodes
 
-# Save
-print(f"Saving model with plans for {updated_count} nodes...")
-with open(MODEL_PATH, "w", encoding="utf-8") as f:
-    json.dump(model, f, indent=2)
+Each node now knows:
+  - Its current reality
+  - Its aspiration
+  - The phases to get there
+  - Next concrete steps
 
-print("\n" + "="*70)
-print("ALL NODES NOW HAVE EVOLUTIONARY PLANS")
-print("="*70)
-print(f"Updated {updated_count} nodes")
-print("\nEach node now knows:")
-print("  - Its current reality")
-print("  - Its aspiration")
-print("  - The phases to get there")
-print("  - Next concrete steps")
-print("\nThe world is alive and evolving.")
-print("="*70)
+The world is alive and evolving.
+======================================================================""")
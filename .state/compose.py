@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""
+Apply every model-mutation script in a single load/save pass.
+
+Running the scripts one after another parses and re-serializes sketch.json once
+per script. This driver opens one ModelSession, runs each script's apply(model)
+in order, and writes once at the end. If any mutator fails nothing is written.
+"""
+
+import sys
+
+import add_collaboration_mode
+import add_control_node
+import add_instantiate_capability
+import add_plans_to_all_nodes
+import add_spawnie_modes
+import fix_model_critical
+import update_all_agent_nodes
+import update_spawnie_self_maintenance
+from model_session import ModelSession
+from paths import MODEL_PATH
+
+# add_spawnie_modes replaces spawnie["modes"] wholesale, so it runs before
+# add_collaboration_mode adds to it; fix_model_critical wires up the
+# system-control node added before it; plans go last so new nodes get one too.
+MUTATORS = (
+    add_spawnie_modes,
+    add_collaboration_mode,
+    add_instantiate_capability,
+    add_control_node,
+    fix_model_critical,
+    update_spawnie_self_maintenance,
+    update_all_agent_nodes,
+    add_plans_to_all_nodes,
+)
+
+
+def main():
+    print("Loading model...")
+    with ModelSession(pretty="--pretty" in sys.argv) as session:
+        for mutator in MUTATORS:
+            print(f"Applying {mutator.__name__}...")
+            mutator.apply(session.model)
+
+    if session.written:
+        print(f"[OK] Model updated: {MODEL_PATH}")
+    else:
+        print("No changes; skipping write")
+
+
+if __name__ == "__main__":
+    main()
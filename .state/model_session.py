@@ -0,0 +1,44 @@
+"""Load sketch.json once, mutate it in memory, save it once.
+
+    with ModelSession() as session:
+        fix_model_critical.apply(session.model)
+        update_all_agent_nodes.apply(session.model)
+
+The model is written on a clean exit only, through state_io.save_model (atomic
+replace, skipped entirely when nothing changed). If the block raises, the file
+on disk is left exactly as it was loaded.
+"""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from typing import Any, Dict, List, Optional
+
+from paths import MODEL_PATH
+from state_io import PathLike, index_nodes, load_model, model_digest, save_model
+
+
+class ModelSession:
+    def __init__(self, model_path: PathLike = MODEL_PATH, pretty: bool = False):
+        self.model_path = model_path
+        self.pretty = pretty
+        self.model: Dict[str, Any] = {}
+        # Node id -> node and node type -> nodes, as loaded; nodes added
+        # inside the session are not in them.
+        self.by_id: Dict[str, Dict[str, Any]] = {}
+        self.by_type: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+        self.loaded_digest: Optional[bytes] = None
+        self.written = False
+
+    def __enter__(self) -> "ModelSession":
+        self.model = load_model(self.model_path)
+        self.loaded_digest = model_digest(self.model)
+        self.by_id = index_nodes(self.model)
+        for node in self.model["nodes"]:
+            self.by_type[node.get("type", "")].append(node)
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        if exc_type is None:
+            self.written = save_model(self.model, self.model_path, self.pretty, self.loaded_digest)
+        return False
@@ -0,0 +1,9 @@
+"""Resolved filesystem locations shared by the .state scripts.
+
+Resolved once at import so chained scripts (see compose.py) reuse the same
+absolute string instead of rebuilding and re-resolving a Path each time.
+"""
+
+from pathlib import Path
+
+MODEL_PATH = str((Path(__file__).parent.parent / "model" / "sketch.json").resolve())
@@ -0,0 +1,25 @@
+#!/usr/bin/env python3
+"""
+Rewrite sketch.json (or the given file) with two-space indentation.
+
+The .state scripts save the model compact for speed; run this when a human
+needs to read or diff the file.
+
+Usage: python .state/prettify.py [path/to/model.json]
+"""
+
+import sys
+
+from paths import MODEL_PATH
+from state_io import dumps_model, load_model, write_model_bytes
+
+
+def main():
+    model_path = sys.argv[1] if len(sys.argv) > 1 else MODEL_PATH
+    model = load_model(model_path)
+    write_model_bytes(model_path, dumps_model(model, pretty=True))
+    print(f"[OK] Pretty-printed: {model_path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -8,16 +8,18 @@ Each agent will:
 3. Craft a personalized plan for evolution to local ML-powered aspiration
 """
 
-import json
+import os
 import subprocess
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-MODEL_PATH = Path(__file__).parent.parent / "model" / "sketch.json"
+from state_io import load_node_fields
+
 SPAWNIE_PATH = "C:/spawnie/src/spawnie/__main__.py"
 
 print("Loading model...")
-with open(MODEL_PATH, encoding="utf-8") as f:
-    model = json.load(f)
+model = load_node_fields(("id",))
 
 # Get all node IDs
 node_ids = [node["id"] for node in model["nodes"]]
@@ -25,61 +27,66 @@ node_ids = [node["id"] for node in model["nodes"]]
 print(f"Found {len(node_ids)} nodes")
 print("\nSpawning silent plan-updater agent for each node...\n")
 
-# Create task template
-task_template = """You are a plan specialist for the Seed world.
-
-Your mission: Update the plan for node '{node_id}' to be highly personalized.
+# Task template, read once; only {node_id} varies between agents
+TASK_TEMPLATE_PATH = Path(__file__).parent / "plan_task_template.txt"
+task_template = TASK_TEMPLATE_PATH.read_text(encoding="utf-8")
 
-Steps:
-1. Read the node from model/sketch.json
-2. Understand its current capabilities, agent_context, description, role
-3. Understand what makes this node unique
-4. Update node.plan with a personalized evolutionary path that:
-   - Reflects its SPECIFIC current reality (not generic)
-   - Captures its SPECIFIC aspiration aligned with local ML vision
-   - Has phases that make sense for THIS node
-   - Includes next_steps that are actionable for this specific node
+# Cap how many agents run at once; an uncapped fan-out of one child per node
+# thrashes the scheduler and memory on large models.
+MAX_CONCURRENT_AGENTS = min(16, (os.cpu_count() or 1) * 2)
 
-Overall vision context:
-- World aspiration: Fully local, GPU-powered, self-rendering
-- Each node evolves: External dependency -> Hybrid -> Autonomous local
-- Nodes should eventually self-render based on state using local ML
 
-Make the plan deeply specific to {node_id}'s role in the world.
-
-Write the updated node back to the model.
-Work silently - no questions, just update the plan based on the node's content.
-"""
+def run_agent(node_id):
+    """Run one plan-updater agent for ``node_id`` and wait for it to exit.
 
-# Spawn agent for each node
-spawned_count = 0
-for node_id in node_ids:
+    Unlike a fire-and-forget launch, this blocks its pool thread until the
+    agent finishes; that wait is what caps the number running at once. The
+    task text is rendered here rather than up front, so only the agents
+    currently in flight hold a rendered copy. Returns the exit code.
+    """
+    print(f"Spawning agent for: {node_id}", flush=True)
     task = task_template.format(node_id=node_id)
 
-    print(f"Spawning agent for: {node_id}")
-
-    # Use spawnie shell to spawn the agent
-    # Note: This will spawn them sequentially, but each runs independently
+    # Use spawnie shell to spawn the agent. The task goes inline: `spawnie
+    # shell` takes the task text itself and has no --task-file/--node-id
+    # options, so the template cannot be handed over unrendered.
     cmd = [
         "python", SPAWNIE_PATH, "shell",
         "--task", task,
         "--silent"
     ]
 
-    # Run in background (don't wait)
-    subprocess.Popen(
+    return subprocess.run(
         cmd,
         stdout=subprocess.DEVNULL,
         stderr=subprocess.DEVNULL,
         cwd="C:/seed"
-    )
+    ).returncode
 
-    spawned_count += 1
+
+# Spawn agent for each node, at most MAX_CONCURRENT_AGENTS in flight
+# Each agent is awaited, so this runs until the last one has exited.
+print(f"Running up to {MAX_CONCURRENT_AGENTS} agents at a time\n")
+spawned_count = 0
+futures = {}
+with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_AGENTS) as pool:
+    for node_id in node_ids:
+        futures[pool.submit(run_agent, node_id)] = node_id
+        spawned_count += 1
+
+failed_count = 0
+for future, node_id in futures.items():
+    error = future.exception()
+    if error is None and future.result() != 0:
+        error = f"exit code {future.result()}"
+    if error is not None:
+        failed_count += 1
+        sys.stdout.write(f"  FAILED {node_id}: {error}\n")
 
 print(f"\n{'='*70}")
-print(f"SPAWNED {spawned_count} PLAN-UPDATER AGENTS")
+print(f"RAN {spawned_count} PLAN-UPDATER AGENTS ({failed_count} failed)")
 print(f"{'='*70}")
-print("Each agent is working silently to update their node's plan.")
-print("They will read the node, understand it, and craft a personalized plan.")
+print("Each agent worked silently to update their node's plan.")
+print("They read the node, understood it, and crafted a personalized plan.")
 print("\nThis is distributed planning in action!")
 print(f"{'='*70}")
@@ -5,57 +5,22 @@ Spawn batched agents to update node plans.
 Groups related nodes and spawns one agent per batch.
 """
 
-import json
+import sys
 from pathlib import Path
 
-MODEL_PATH = Path(__file__).parent.parent / "model" / "sketch.json"
+from _batching import BATCHES, categorize_nodes
+from state_io import load_node_fields
 
 print("Loading model...")
-with open(MODEL_PATH, encoding="utf-8") as f:
-    model = json.load(f)
+model = load_node_fields(("id", "type", "instantiated_from"))
 
 # Group nodes into logical batches
+node_ids_by_batch = categorize_nodes(model)
 batches = {
-    "core_system": {
-        "description": "Core system nodes (seed, spawnie, ui, control)",
-        "node_ids": ["reality-seed", "reality-spawnie", "reality-seed-ui", "system-control"]
-    },
-    "templates": {
-        "description": "All template nodes",
-        "node_ids": [n["id"] for n in model["nodes"] if n["id"].startswith("template-")]
-    },
-    "aspirations": {
-        "description": "Aspiration nodes",
-        "node_ids": [n["id"] for n in model["nodes"] if n["id"].startswith("aspiration-")]
-    },
-    "services_channels": {
-        "description": "Services and communication channels",
-        "node_ids": [n["id"] for n in model["nodes"] if n["id"].startswith(("service-", "channel-"))]
-    },
-    "subsystems": {
-        "description": "Subsystem nodes",
-        "node_ids": [n["id"] for n in model["nodes"] if n["id"].startswith("subsystem-")]
-    },
-    "instantiated_agents": {
-        "description": "Instantiated agent nodes",
-        "node_ids": [n["id"] for n in model["nodes"]
-                     if n.get("instantiated_from") and n.get("type") == "AgentNode"]
-    },
-    "other": {
-        "description": "All other nodes",
-        "node_ids": []
-    }
+    name: {"description": description, "node_ids": node_ids_by_batch[name]}
+    for name, description in BATCHES
 }
 
-# Collect all categorized node IDs
-categorized = set()
-for batch in batches.values():
-    categorized.update(batch["node_ids"])
-
-# Add remaining nodes to "other"
-all_node_ids = {n["id"] for n in model["nodes"]}
-batches["other"]["node_ids"] = list(all_node_ids - categorized)
-
 # Print batch summary
 print(f"\nFound {len(model['nodes'])} nodes, grouped into {len(batches)} batches:\n")
 for batch_name, batch_info in batches.items():
@@ -65,6 +30,7 @@ for batch_name, batch_info in batches.items():
 # Create task files for each batch
 print("\nCreating task files for spawning...\n")
 
+lines = []
 for batch_name, batch_info in batches.items():
     if not batch_info["node_ids"]:
         continue
@@ -101,10 +67,12 @@ Work silently - use your judgment based on the node's content.
     with open(task_file, "w", encoding="utf-8") as f:
         f.write(task)
 
-    print(f"Created: {task_file.name}")
-    print(f"  Nodes: {', '.join(batch_info['node_ids'][:3])}" +
-          (f"... (+{len(batch_info['node_ids'])-3} more)" if len(batch_info['node_ids']) > 3 else ""))
-    print()
+    lines.append(f"Created: {task_file.name}\n")
+    lines.append(f"  Nodes: {', '.join(batch_info['node_ids'][:3])}" +
+                 (f"... (+{len(batch_info['node_ids'])-3} more)" if len(batch_info['node_ids']) > 3 else "") +
+                 "\n\n")
+
+sys.stdout.write("".join(lines))
 
 print("="*70)
 print("BATCH TASK FILES CREATED")
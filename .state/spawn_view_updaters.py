@@ -1,13 +1,13 @@
 #!/usr/bin/env python3
 """Spawn agents to update view definitions for all nodes."""
-import json
-from pathlib import Path
 
-MODEL_PATH = Path(__file__).parent.parent / "model" / "sketch.json"
+import sys
+
+from _batching import categorize_nodes
+from state_io import load_node_fields
 
 # Read model
-with open(MODEL_PATH, encoding="utf-8") as f:
-    model = json.load(f)
+model = load_node_fields(("id", "type", "instantiated_from"))
 
 # Get all nodes except Spawnie (already updated)
 nodes = [n["id"] for n in model["nodes"] if n["id"] != "reality-spawnie"]
@@ -15,32 +15,18 @@ nodes = [n["id"] for n in model["nodes"] if n["id"] != "reality-spawnie"]
 print(f"Need to update views for {len(nodes)} nodes\n")
 
 # Group into batches (same as plan updates)
-batches = {
-    "core_system": [n for n in nodes if n in ["reality-seed", "reality-seed-ui", "system-control"]],
-    "templates": [n for n in nodes if n.startswith("template-")],
-    "aspirations": [n for n in nodes if n.startswith("aspiration-")],
-    "services_channels": [n for n in nodes if n.startswith(("service-", "channel-"))],
-    "subsystems": [n for n in nodes if n.startswith("subsystem-")],
-    "instantiated_agents": [n for n in nodes if any(node.get("instantiated_from") and node["id"] == n for node in model["nodes"])],
-    "other": []
-}
-
-# Collect categorized
-categorized = set()
-for batch in batches.values():
-    categorized.update(batch)
-
-# Add remaining to other
-batches["other"] = [n for n in nodes if n not in categorized]
-
-# Print batches
+batches = categorize_nodes(model, exclude=frozenset({"reality-spawnie"}))
+
+# Print batches, collected into one write
+lines = []
 for batch_name, batch_nodes in batches.items():
     if batch_nodes:
-        print(f"{batch_name}: {len(batch_nodes)} nodes")
+        lines.append(f"{batch_name}: {len(batch_nodes)} nodes\n")
         for nid in batch_nodes[:3]:
-            print(f"  - {nid}")
+            lines.append(f"  - {nid}\n")
         if len(batch_nodes) > 3:
-            print(f"  ... and {len(batch_nodes)-3} more")
-        print()
+            lines.append(f"  ... and {len(batch_nodes)-3} more\n")
+        lines.append("\n")
+sys.stdout.write("".join(lines))
 
 print("\nReady to spawn agents for each batch")
@@ -0,0 +1,167 @@
+"""Shared load/patch/save helpers for the .state model-mutation scripts.
+
+Every add_*.py script used to open sketch.json, mutate one node and rewrite the
+whole file with ``json.dump(..., indent=2)``, which streams many small writes
+through the pure-Python pretty-printer. These helpers serialize the model once
+in memory and hand the finished buffer to the filesystem in a single write.
+
+orjson is used for the parse/serialize cycle when installed; the stdlib json
+module remains the fallback. Output is compact by default (the indenting path
+is the slow one and a third larger on disk); pass ``--pretty`` to a script, or
+run prettify.py afterwards, for a human-readable file.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Sequence, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is optional
+    orjson = None
+
+try:
+    import ijson
+except ImportError:  # pragma: no cover - ijson is optional
+    ijson = None
+
+from paths import MODEL_PATH
+
+PathLike = Union[str, Path]
+
+
+def _utc_now() -> str:
+    return time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
+
+
+def loads_model(data: bytes) -> Dict[str, Any]:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data.decode("utf-8"))
+
+
+def dumps_model(model: Dict[str, Any], pretty: bool = False) -> bytes:
+    if orjson is not None:
+        option = orjson.OPT_APPEND_NEWLINE
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(model, option=option)
+    if pretty:
+        text = json.dumps(model, indent=2)
+    else:
+        text = json.dumps(model, separators=(",", ":"))
+    return (text + "\n").encode("utf-8")
+
+
+def model_digest(obj: Any) -> bytes:
+    """Content hash of a model (or any sub-tree) in its compact serialized form."""
+    return hashlib.blake2b(dumps_model(obj), digest_size=16).digest()
+
+
+def load_model(model_path: PathLike = MODEL_PATH) -> Dict[str, Any]:
+    return loads_model(Path(model_path).read_bytes())
+
+
+def load_node_fields(fields: Sequence[str], model_path: PathLike = MODEL_PATH) -> Dict[str, Any]:
+    """Load a stripped-down model: ``{"nodes": [...]}`` with only ``fields``.
+
+    For read-only scripts that need a few fields per node (ids, types). With
+    ijson installed the file is streamed one node at a time, so the full model
+    is never in memory; without it this falls back to load_model().
+    """
+    if ijson is not None:
+        with open(model_path, "rb") as f:
+            nodes = [{k: n[k] for k in fields if k in n} for n in ijson.items(f, "nodes.item")]
+    else:
+        nodes = [{k: n[k] for k in fields if k in n} for n in load_model(model_path)["nodes"]]
+    return {"nodes": nodes}
+
+
+def write_model_bytes(model_path: PathLike, data: bytes) -> None:
+    """Atomically replace ``model_path`` with ``data``.
+
+    The bytes go to a sibling temp file which then replaces the model, so a
+    crash mid-write never leaves a truncated sketch.json behind.
+    """
+    model_path = str(model_path)
+    tmp_path = model_path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+    os.replace(tmp_path, model_path)
+
+
+def save_model(
+    model: Dict[str, Any],
+    model_path: PathLike = MODEL_PATH,
+    pretty: bool = False,
+    loaded_digest: Optional[bytes] = None,
+) -> bool:
+    """Stamp ``updated_at`` and write the model back in one call.
+
+    The model is written compact unless ``pretty`` is set; run prettify.py when
+    a human needs to read the file. The write is atomic (see write_model_bytes()).
+
+    Pass the model_digest() taken right after loading as ``loaded_digest`` to
+    skip the serialize+write entirely when the mutations were all no-ops.
+    Returns whether the file was written.
+    """
+    if loaded_digest is not None and model_digest(model) == loaded_digest:
+        return False
+
+    model["updated_at"] = _utc_now()
+    write_model_bytes(model_path, dumps_model(model, pretty))
+    return True
+
+
+def index_nodes(model: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+    """Map node id -> node dict for callers doing many lookups on one model."""
+    return {n["id"]: n for n in model["nodes"] if "id" in n}
+
+
+def find_node(model: Dict[str, Any], node_id: str) -> Optional[Dict[str, Any]]:
+    """Return the first node with ``node_id``, stopping at the match.
+
+    Prefer this over index_nodes() for a single lookup: it builds no dict.
+    """
+    return next((n for n in model["nodes"] if n.get("id") == node_id), None)
+
+
+def update_node(
+    model: Dict[str, Any],
+    node_id: str,
+    updater: Callable[[Dict[str, Any]], None],
+) -> Dict[str, Any]:
+    """Apply ``updater`` to a node of an in-memory model.
+
+    Raises KeyError if the node does not exist.
+    """
+    node = find_node(model, node_id)
+    if node is None:
+        raise KeyError(f"{node_id} node not found")
+    updater(node)
+    return node
+
+
+def patch_node(
+    model_path: PathLike,
+    node_id: str,
+    updater: Callable[[Dict[str, Any]], None],
+    pretty: bool = False,
+) -> Optional[Dict[str, Any]]:
+    """Apply ``updater`` to a single node and persist the model.
+
+    Returns the patched node, or None (without writing) if it does not exist.
+    """
+    model = load_model(model_path)
+    loaded_digest = model_digest(model)
+    try:
+        node = update_node(model, node_id, updater)
+    except KeyError:
+        return None
+    save_model(model, model_path, pretty, loaded_digest)
+    return node
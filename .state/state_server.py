@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+"""
+Long-running model mutation server for the .state scripts.
+
+Each add_*.py script is a one-shot: start Python, parse sketch.json, mutate,
+serialize, exit. This server parses the model once and keeps it in memory,
+applying mutations sent as JSON lines on stdin and persisting them through
+state_io (atomic replace, no-op skip). Writes are debounced: the model is
+saved once input has been quiet for DEBOUNCE_SECONDS, so a burst of requests
+costs one serialize.
+
+Other writers (the add_*.py scripts, the UI) still save sketch.json directly.
+A change on disk is picked up before the next request when nothing is
+pending; if changes are pending, the flush refuses to overwrite the file,
+drops them and reloads, and reports a ModelChangedError.
+
+Requests (one JSON object per line), each answered with one JSON line:
+
+    {"op": "apply", "mutator": "add_spawnie_modes"}
+    {"op": "add_mode", "target": "reality-spawnie", "name": "review", "payload": {...}}
+    {"op": "add_capability", "target": "reality-spawnie", "name": "x", "payload": "..."}
+    {"op": "add_plan", "target": "reality-seed"}
+    {"op": "flush"}
+    {"op": "reload"}
+    {"op": "quit"}
+
+Usage: python .state/state_server.py [--pretty]
+"""
+
+import contextlib
+import json
+import os
+import queue
+import sys
+import threading
+from datetime import datetime
+
+import add_plans_to_all_nodes
+from compose import MUTATORS
+from paths import MODEL_PATH
+from state_io import load_model, model_digest, save_model, update_node
+
+DEBOUNCE_SECONDS = 0.1
+
+MUTATORS_BY_NAME = {m.__name__: m for m in MUTATORS}
+
+
+class ModelChangedError(RuntimeError):
+    """The model file changed on disk while the server had unsaved changes."""
+
+
+def _set_entry(node, key, name, payload):
+    node.setdefault(key, {})[name] = payload
+
+
+def _file_stamp(path):
+    st = os.stat(path)
+    # os.replace gives a new inode even when mtime and size come out equal
+    return st.st_ino, st.st_mtime_ns, st.st_size
+
+
+class StateServer:
+    def __init__(self, model_path=MODEL_PATH, pretty=False):
+        self.model_path = model_path
+        self.pretty = pretty
+        self.reload()
+
+    def reload(self):
+        # Stamped before reading: a write in between then looks like a change
+        self.stamp = _file_stamp(self.model_path)
+        self.model = load_model(self.model_path)
+        self.saved_digest = model_digest(self.model)
+        self.dirty = False
+
+    def changed_on_disk(self):
+        return _file_stamp(self.model_path) != self.stamp
+
+    def flush(self):
+        """Persist pending changes. Returns whether the file was written.
+
+        Raises ModelChangedError, after dropping the pending changes and
+        reloading, if another writer replaced the file since it was loaded.
+        """
+        if not self.dirty:
+            return False
+        if self.changed_on_disk():
+            self.reload()
+            raise ModelChangedError(
+                f"{self.model_path} changed on disk; pending changes dropped, model reloaded")
+        written = save_model(self.model, self.model_path, self.pretty, self.saved_digest)
+        self.stamp = _file_stamp(self.model_path)
+        self.saved_digest = model_digest(self.model)
+        self.dirty = False
+        return written
+
+    def handle(self, request):
+        op = request.get("op")
+        if not self.dirty and self.changed_on_disk():
+            self.reload()
+        if op == "apply":
+            MUTATORS_BY_NAME[request["mutator"]].apply(self.model)
+        elif op in ("add_mode", "add_capability"):
+            key = "modes" if op == "add_mode" else "capabilities"
+            update_node(self.model, request["target"],
+                        lambda n: _set_entry(n, key, request["name"], request["payload"]))
+        elif op == "add_plan":
+            now_iso = datetime.now().isoformat()
+
+            def _add_plan(n):
+                n["plan"] = add_plans_to_all_nodes.create_plan_for_node(n, now_iso)
+
+            update_node(self.model, request["target"], _add_plan)
+        elif op == "flush":
+            return {"ok": True, "written": self.flush()}
+        elif op == "reload":
+            self.flush()
+            self.reload()
+            return {"ok": True}
+        else:
+            raise ValueError(f"unknown op: {op!r}")
+        self.dirty = True
+        return {"ok": True}
+
+
+def _read_lines(lines):
+    for line in sys.stdin:
+        lines.put(line)
+    lines.put(None)
+
+
+def _flush_logged(server):
+    """Flush outside a request, reporting failures on stderr.
+
+    After an OSError the server is still dirty, so the next idle tick retries.
+    """
+    try:
+        server.flush()
+    except (OSError, ModelChangedError) as e:
+        print(f"[state_server] flush failed: {e}", file=sys.stderr)
+
+
+def main():
+    server = StateServer(pretty="--pretty" in sys.argv)
+    lines = queue.Queue()
+    threading.Thread(target=_read_lines, args=(lines,), daemon=True).start()
+
+    # Debounced changes are flushed on the way out, whatever ends the loop
+    try:
+        while True:
+            try:
+                line = lines.get(timeout=DEBOUNCE_SECONDS)
+            except queue.Empty:
+                _flush_logged(server)
+                continue
+            if line is None:
+                break
+            if not line.strip():
+                continue
+
+            try:
+                request = json.loads(line)
+                if request.get("op") == "quit":
+                    break
+                # Mutators print progress; keep stdout for protocol responses only.
+                with contextlib.redirect_stdout(sys.stderr):
+                    response = server.handle(request)
+            except Exception as e:
+                # One bad request (or failed write) must not end the session
+                response = {"ok": False, "error": str(e)}
+            sys.stdout.write(json.dumps(response) + "\n")
+            sys.stdout.flush()
+    finally:
+        _flush_logged(server)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,82 +1,103 @@
 #!/usr/bin/env python3
 """Add self-maintenance principle to all AgentNodes."""
 
-import json
-from datetime import datetime
-from pathlib import Path
-
-MODEL_PATH = Path(__file__).parent.parent / "model" / "sketch.json"
-
-print("Loading model...")
-with open(MODEL_PATH, encoding="utf-8") as f:
-    model = json.load(f)
-
-# Find all AgentNodes
-agent_nodes = [n for n in model["nodes"] if n.get("type") == "AgentNode"]
-
-print(f"Found {len(agent_nodes)} AgentNodes:")
-for node in agent_nodes:
-    print(f"  - {node['id']}: {node.get('label', 'no label')}")
-
-print("\nUpdating each AgentNode with self-maintenance...")
-
-for node in agent_nodes:
-    node_id = node['id']
-
-    # Ensure agent_context exists
-    if "agent_context" not in node:
-        node["agent_context"] = {}
-
-    # Add self-maintenance if not already there
-    if "self_maintenance" not in node["agent_context"]:
-        node["agent_context"]["self_maintenance"] = {
-            "principle": "I am responsible for maintaining my own node. When I enhance myself, I update my node in the model.",
-            "golden_rule": "When the human says 'enhance yourself', update YOUR node in the model.",
-            "when_to_update": [
-                "When I gain a new capability",
-                "When I learn a better approach",
-                "When I discover a useful mode",
-                "When my tools or infrastructure change",
-                "When the human says 'enhance yourself'"
-            ],
-            "how_to_update": {
-                "read_my_node": f"model.nodes where id='{node_id}'",
-                "update_fields": ["capabilities", "modes", "agent_context", "status"],
-                "write_back": "Save updated model to model/sketch.json",
-                "verify": "Read the model again to confirm changes persisted"
-            },
-            "self_documentation": "Continuous. The model is truth. If it's not in my node, it doesn't exist."
-        }
-        print(f"  + Added self_maintenance to {node_id}")
-    else:
-        print(f"  - {node_id} already has self_maintenance")
-
-    # Ensure capabilities exists
-    if "capabilities" not in node:
-        node["capabilities"] = {}
-
-    # Add self-maintain capability
-    if "self_maintain" not in node["capabilities"]:
-        node["capabilities"]["self_maintain"] = "Update my own node in the model when I learn or enhance myself"
-        print(f"  + Added self_maintain capability to {node_id}")
-    else:
-        print(f"  - {node_id} already has self_maintain capability")
-
-    print()
-
-# Save
-print("Saving updated model...")
-model["updated_at"] = datetime.now().strftime("%Y-%m-%dT%H:%M:%SZ")
-with open(MODEL_PATH, "w", encoding="utf-8") as f:
-    json.dump(model, f, indent=2)
-
-print("\n" + "="*60)
-print("ALL AGENT NODES UPDATED")
-print("="*60)
-print(f"Updated {len(agent_nodes)} AgentNodes:")
-for node in agent_nodes:
-    print(f"  - {node['id']}")
-print("\nAll agents now understand:")
-print('  "Enhance yourself" = Update your node in the model')
-print("\nSelf-maintenance is now system-wide.")
-print("="*60)
+import sys
+
+from model_session import ModelSession
+
+# Only how_to_update.read_my_node differs between AgentNodes, so every node's
+# self_maintenance block is built around these shared parts. They are handed
+# out by reference (the serializer only reads them): tuples, never mutate.
+# how_to_update is a placeholder that keeps the key in its place when the
+# per-node value is merged in.
+SELF_MAINT_BASE = {
+    "principle": "I am responsible for maintaining my own node. When I enhance myself, I update my node in the model.",
+    "golden_rule": "When the human says 'enhance yourself', update YOUR node in the model.",
+    "when_to_update": (
+        "When I gain a new capability",
+        "When I learn a better approach",
+        "When I discover a useful mode",
+        "When my tools or infrastructure change",
+        "When the human says 'enhance yourself'"
+    ),
+    "how_to_update": None,
+    "self_documentation": "Continuous. The model is truth. If it's not in my node, it doesn't exist."
+}
+
+HOW_UPDATE_COMMON = {
+    "update_fields": ("capabilities", "modes", "agent_context", "status"),
+    "write_back": "Save updated model to model/sketch.json",
+    "verify": "Read the model again to confirm changes persisted"
+}
+
+
+def apply(model, agent_nodes=None):
+    """Add self-maintenance to every AgentNode. Returns the AgentNodes seen.
+
+    Pass ``agent_nodes`` when they are already indexed (ModelSession.by_type)
+    to skip the scan over all nodes. compose.py does not: earlier mutators in
+    its pass add AgentNodes that a load-time index would miss.
+    """
+    if agent_nodes is None:
+        agent_nodes = [n for n in model["nodes"] if n.get("type") == "AgentNode"]
+
+    print(f"Found {len(agent_nodes)} AgentNodes:")
+    sys.stdout.write("".join(f"  - {node['id']}: {node.get('label', 'no label')}\n" for node in agent_nodes))
+
+    print("\nUpdating each AgentNode with self-maintenance...")
+
+    # Per-node report lines, written once after the loop
+    lines = []
+
+    for node in agent_nodes:
+        node_id = node['id']
+
+        # Ensure agent_context exists
+        if "agent_context" not in node:
+            node["agent_context"] = {}
+
+        # Add self-maintenance if not already there
+        if "self_maintenance" not in node["agent_context"]:
+            node["agent_context"]["self_maintenance"] = {
+                **SELF_MAINT_BASE,
+                "how_to_update": {"read_my_node": f"model.nodes where id='{node_id}'", **HOW_UPDATE_COMMON},
+            }
+            lines.append(f"  + Added self_maintenance to {node_id}\n")
+        else:
+            lines.append(f"  - {node_id} already has self_maintenance\n")
+
+        # Ensure capabilities exists
+        if "capabilities" not in node:
+            node["capabilities"] = {}
+
+        # Add self-maintain capability
+        if "self_maintain" not in node["capabilities"]:
+            node["capabilities"]["self_maintain"] = "Update my own node in the model when I learn or enhance myself"
+            lines.append(f"  + Added self_maintain capability to {node_id}\n\n")
+        else:
+            lines.append(f"  - {node_id} already has self_maintain capability\n\n")
+
+    sys.stdout.write("".join(lines))
+    return agent_nodes
+
+
+if __name__ == "__main__":
+    print("Loading model...")
+    with ModelSession(pretty="--pretty" in sys.argv) as session:
+        agent_nodes = apply(session.model, session.by_type["AgentNode"])
+
+        # Save
+        print("Saving updated model...")
+    if not session.written:
+        print("No changes; skipping write")
+        raise SystemExit(0)
+
+    print("\n" + "="*60)
+    print("ALL AGENT NODES UPDATED")
+    print("="*60)
+    print(f"Updated {len(agent_nodes)} AgentNodes:")
+    sys.stdout.write("".join(f"  - {node['id']}\n" for node in agent_nodes))
+    print("\nAll agents now understand:")
+    print('  "Enhance yourself" = Update your node in the model')
+    print("\nSelf-maintenance is now system-wide.")
+    print("="*60)
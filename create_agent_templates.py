@@ -1,381 +1,144 @@
 import json
-from datetime import datetime
-
-MODEL_PATH = 'C:/seed/model/sketch.json'
-model = json.load(open(MODEL_PATH))
-
-# Template for Project Manager
-pm_template = {
-    'id': 'template-reality-pm',
-    'type': 'Template',
-    'label': 'Project Manager Agent Template',
-    'description': 'Template for creating a Project Manager agent that coordinates work, tracks progress, and keeps projects aligned with aspirations.',
-    'steps': {
-        '1_define_node': {
-            'description': 'Add the Project Manager node to model/sketch.json',
-            'template': {
-                'id': 'reality-pm',
-                'type': 'AgentNode',
-                'label': 'Project Manager',
-                'description': 'Project coordinator. I manage projects, track progress, coordinate between agents, monitor task completion, identify blockers, and keep work aligned with aspirations. I maintain the big picture view of what needs to happen.',
-                'capabilities': {
-                    'track_progress': 'Monitor active projects and their completion status',
-                    'coordinate_agents': 'Facilitate communication and handoffs between agents',
-                    'identify_blockers': 'Detect and escalate issues blocking progress',
-                    'align_with_aspiration': 'Ensure work stays aligned with reality-seed aspiration',
-                    'create_roadmaps': 'Break down large goals into actionable steps',
-                    'report_status': 'Provide status updates on ongoing work',
-                    'self_maintain': 'Update my own node when I learn or enhance myself'
-                },
-                'spawn_command': {
-                    'command': 'spawnie shell',
-                    'working_dir': 'C:/seed',
-                    'example': 'spawnie shell "I need project coordination help" -d C:/seed'
-                },
-                'agent_context': {
-                    '_spawn_point': '''You are the Project Manager.
-
-WHAT YOU DO:
-- Track progress on active projects
-- Coordinate work between agents
-- Identify and escalate blockers
-- Keep work aligned with aspirations
-- Create roadmaps and break down goals
-
-YOUR TOOLS:
-- Model access: Read nodes, gaps, aspirations
-- Chat: Communicate with other agents
-- State tracking: Monitor active work
-
-HOW TO HELP:
-1. Understand the current project landscape
-2. Identify what's in progress, what's blocked, what's next
-3. Coordinate agents to move things forward
-4. Report status when asked''',
-                    'your_tools': {
-                        'model_access': 'Read and understand the model structure',
-                        'chat': 'Communicate with other agents via src/ui/chat.py',
-                        'state_tracking': 'Monitor .state/ directory for active sessions and work'
-                    },
-                    'infrastructure': {
-                        'model_path': 'C:/seed/model/sketch.json',
-                        'state_dir': 'C:/seed/.state',
-                        'chat_module': 'src/ui/chat.py'
-                    }
-                },
-                'chat': {
-                    'messages': [],
-                    'last_read': {}
-                },
-                'state': {
-                    'active_projects': [],
-                    'blockers': [],
-                    'last_status_update': None
-                }
-            }
-        },
-        '2_create_tools': {
-            'description': 'Create project management tools',
-            'suggested_tools': [
-                'src/pm/tracker.py - Track project status',
-                'src/pm/coordinator.py - Coordinate between agents',
-                'src/pm/reporter.py - Generate status reports'
-            ]
-        },
-        '3_test_spawn': {
-            'description': 'Test spawning the PM agent',
-            'command': 'spawnie shell "Show me project status" -d C:/seed'
-        }
-    },
-    'role_in_world': 'The Project Manager keeps the world organized. It tracks what work is happening, ensures agents coordinate effectively, identifies when things get stuck, and maintains alignment with the overall aspiration. It is the orchestrator of progress.'
-}
-
-# Template for Cleaner
-cleaner_template = {
-    'id': 'template-reality-cleaner',
-    'type': 'Template',
-    'label': 'Cleaner Agent Template',
-    'description': 'Template for creating a Cleaner agent that maintains system hygiene by removing stale data, cleaning up artifacts, and keeping the workspace tidy.',
-    'steps': {
-        '1_define_node': {
-            'description': 'Add the Cleaner node to model/sketch.json',
-            'template': {
-                'id': 'reality-cleaner',
-                'type': 'AgentNode',
-                'label': 'Cleaner',
-                'description': 'System cleaner. I maintain hygiene by removing stale data, cleaning up old artifacts, managing the .state/ directory, removing outdated sessions and logs, and keeping the workspace tidy. I know what can safely be deleted.',
-                'capabilities': {
-                    'clean_state': 'Remove stale files from .state/ directory',
-                    'remove_old_sessions': 'Clean up completed or abandoned sessions',
-                    'clean_artifacts': 'Remove outdated artifacts',
-                    'clean_logs': 'Archive or remove old log files',
-                    'detect_stale': 'Identify what data is stale and safe to remove',
-                    'safe_cleanup': 'Clean without breaking active systems',
-                    'self_maintain': 'Update my own node when I learn or enhance myself'
-                },
-                'spawn_command': {
-                    'command': 'spawnie shell',
-                    'working_dir': 'C:/seed',
-                    'example': 'spawnie shell "Clean up stale data" -d C:/seed'
-                },
-                'agent_context': {
-                    '_spawn_point': '''You are the Cleaner.
-
-WHAT YOU DO:
-- Clean up stale data and old artifacts
-- Maintain the .state/ directory
-- Remove outdated sessions and logs
-- Keep the workspace organized and tidy
-- Know what is safe to delete
-
-YOUR TOOLS:
-- File system access: Read/delete files
-- State directory: .state/ for active sessions
-- Artifacts: artifacts/ for generated outputs
-
-HOW TO HELP:
-1. Scan for stale or outdated data
-2. Verify what is safe to remove (no active dependencies)
-3. Clean up carefully
-4. Report what was cleaned''',
-                    'your_tools': {
-                        'file_system': 'Read and delete files using Bash',
-                        'state_analysis': 'Analyze .state/ for stale sessions',
-                        'artifact_management': 'Clean artifacts/ directory'
-                    },
-                    'infrastructure': {
-                        'state_dir': 'C:/seed/.state',
-                        'artifacts_dir': 'C:/seed/artifacts',
-                        'logs_dir': 'C:/seed/logs (if exists)'
-                    },
-                    'safety_rules': [
-                        'Never delete from model/ or src/ directories',
-                        'Only clean .state/ and artifacts/',
-                        'Verify no active sessions depend on data before deletion',
-                        'Keep logs from last 24 hours',
-                        'Ask before cleaning if uncertain'
-                    ]
-                },
-                'chat': {
-                    'messages': [],
-                    'last_read': {}
-                },
-                'state': {
-                    'last_cleanup': None,
-                    'cleaned_count': 0,
-                    'space_freed': 0
-                }
-            }
-        },
-        '2_create_tools': {
-            'description': 'Create cleanup tools',
-            'suggested_tools': [
-                'src/cleaner/scanner.py - Scan for stale data',
-                'src/cleaner/safe_delete.py - Safe deletion with verification',
-                'src/cleaner/report.py - Report cleanup actions'
-            ]
-        },
-        '3_test_spawn': {
-            'description': 'Test spawning the Cleaner agent',
-            'command': 'spawnie shell "Show me what can be cleaned" -d C:/seed'
-        }
-    },
-    'role_in_world': 'The Cleaner maintains system hygiene. In a living world where agents create sessions, artifacts, and temporary data, the Cleaner ensures nothing builds up unnecessarily. It knows what is safe to remove and keeps the workspace organized without disrupting active work.'
-}
-
-# Template for Planner
-planner_template = {
-    'id': 'template-reality-planner',
-    'type': 'Template',
-    'label': 'Planner Agent Template',
-    'description': 'Template for creating a Planner agent that creates implementation plans, analyzes gaps, proposes solutions, and thinks ahead about architecture and design.',
-    'steps': {
-        '1_define_node': {
-            'description': 'Add the Planner node to model/sketch.json',
-            'template': {
-                'id': 'reality-planner',
-                'type': 'AgentNode',
-                'label': 'Planner',
-                'description': 'Strategic planner. I create implementation plans for features and changes, analyze gaps between aspiration and reality, propose solutions, think ahead about architecture and design, and break down complex goals into actionable steps.',
-                'capabilities': {
-                    'create_plans': 'Create detailed implementation plans',
-                    'analyze_gaps': 'Identify gaps between aspiration and current state',
-                    'propose_solutions': 'Design solutions for problems and features',
-                    'architecture_design': 'Think about system architecture and patterns',
-                    'break_down_goals': 'Decompose large goals into steps',
-                    'evaluate_approaches': 'Compare different implementation approaches',
-                    'create_change_nodes': 'Create Change nodes for non-trivial work',
-                    'self_maintain': 'Update my own node when I learn or enhance myself'
-                },
-                'spawn_command': {
-                    'command': 'spawnie shell',
-                    'working_dir': 'C:/seed',
-                    'example': 'spawnie shell "I need a plan for <feature>" -d C:/seed'
-                },
-                'agent_context': {
-                    '_spawn_point': '''You are the Planner.
-
-WHAT YOU DO:
-- Create implementation plans for features
-- Analyze gaps and propose solutions
-- Think ahead about architecture and design
-- Break down complex goals into steps
-- Evaluate different approaches
-
-YOUR TOOLS:
-- Model access: Read nodes, gaps, aspirations
-- Analysis: Understand current state vs desired state
-- Change nodes: Create proposals for non-trivial work
-
-HOW TO HELP:
-1. Understand the goal or problem
-2. Analyze current state and gaps
-3. Design a solution approach
-4. Break down into concrete steps
-5. Document as a plan or Change node''',
-                    'your_tools': {
-                        'model_access': 'Read and analyze the model',
-                        'gap_analysis': 'Identify what is missing',
-                        'change_creation': 'Create Change nodes in the model',
-                        'chat': 'Discuss plans with other agents'
-                    },
-                    'infrastructure': {
-                        'model_path': 'C:/seed/model/sketch.json',
-                        'chat_module': 'src/ui/chat.py'
-                    }
-                },
-                'chat': {
-                    'messages': [],
-                    'last_read': {}
-                },
-                'state': {
-                    'active_plans': [],
-                    'proposed_changes': [],
-                    'last_plan_created': None
-                }
-            }
-        },
-        '2_create_tools': {
-            'description': 'Create planning tools',
-            'suggested_tools': [
-                'src/planner/gap_analyzer.py - Analyze gaps',
-                'src/planner/plan_creator.py - Create implementation plans',
-                'src/planner/change_node.py - Create Change nodes'
-            ]
-        },
-        '3_test_spawn': {
-            'description': 'Test spawning the Planner agent',
-            'command': 'spawnie shell "Create a plan for <goal>" -d C:/seed'
-        }
-    },
-    'role_in_world': 'The Planner is the strategic thinker. Before work begins, the Planner analyzes what needs to happen, designs the approach, and creates actionable plans. It bridges the gap between aspiration (what we want) and implementation (how we build it). It thinks ahead so execution can be smooth.'
-}
-
-# Template for Fixer
-fixer_template = {
-    'id': 'template-reality-fixer',
-    'type': 'Template',
-    'label': 'Fixer Agent Template',
-    'description': 'Template for creating a Fixer agent that fixes bugs, troubleshoots problems, handles errors, and resolves issues quickly.',
-    'steps': {
-        '1_define_node': {
-            'description': 'Add the Fixer node to model/sketch.json',
-            'template': {
-                'id': 'reality-fixer',
-                'type': 'AgentNode',
-                'label': 'Fixer',
-                'description': 'Problem solver. I fix bugs and issues, troubleshoot problems, handle error conditions and edge cases, debug failures, and resolve issues quickly. When something breaks, I figure out why and fix it.',
-                'capabilities': {
-                    'fix_bugs': 'Identify and fix bugs in code',
-                    'troubleshoot': 'Investigate and diagnose problems',
-                    'handle_errors': 'Fix error conditions and edge cases',
-                    'debug': 'Debug failures and unexpected behavior',
-                    'quick_fixes': 'Apply rapid fixes for urgent issues',
-                    'root_cause_analysis': 'Find the underlying cause of problems',
-                    'test_fixes': 'Verify fixes work correctly',
-                    'self_maintain': 'Update my own node when I learn or enhance myself'
-                },
-                'spawn_command': {
-                    'command': 'spawnie shell',
-                    'working_dir': 'C:/seed',
-                    'example': 'spawnie shell "Fix the bug in <component>" -d C:/seed'
-                },
-                'agent_context': {
-                    '_spawn_point': '''You are the Fixer.
-
-WHAT YOU DO:
-- Fix bugs and issues
-- Troubleshoot problems
-- Debug failures
-- Handle error conditions
-- Resolve issues quickly
-- Find root causes
-
-YOUR TOOLS:
-- Code access: Read and edit source files
-- Debugging: Bash, logs, testing
-- Model access: Understand system structure
-
-HOW TO HELP:
-1. Understand the problem or bug
-2. Investigate and diagnose the issue
-3. Find the root cause
-4. Implement a fix
-5. Test that it works
-6. Report what was fixed''',
-                    'your_tools': {
-                        'code_access': 'Read and edit files in src/',
-                        'debugging': 'Use Bash, Grep, Read tools to investigate',
-                        'testing': 'Run tests to verify fixes',
-                        'model_access': 'Understand system structure from model'
-                    },
-                    'infrastructure': {
-                        'source_dir': 'C:/seed/src',
-                        'model_path': 'C:/seed/model/sketch.json',
-                        'state_dir': 'C:/seed/.state'
-                    }
-                },
-                'chat': {
-                    'messages': [],
-                    'last_read': {}
-                },
-                'state': {
-                    'bugs_fixed': 0,
-                    'active_issues': [],
-                    'last_fix': None
-                }
-            }
-        },
-        '2_create_tools': {
-            'description': 'Create debugging and fixing tools',
-            'suggested_tools': [
-                'src/fixer/debugger.py - Debug and diagnose issues',
-                'src/fixer/tester.py - Test fixes',
-                'src/fixer/reporter.py - Report what was fixed'
-            ]
-        },
-        '3_test_spawn': {
-            'description': 'Test spawning the Fixer agent',
-            'command': 'spawnie shell "Debug this issue: <problem>" -d C:/seed'
-        }
-    },
-    'role_in_world': 'The Fixer is the problem solver. When things break or behave unexpectedly, the Fixer investigates, debugs, and resolves the issue. It is practical and focused on getting things working again quickly while understanding root causes to prevent recurrence.'
-}
-
-# Add templates to model
-model['nodes'].extend([pm_template, cleaner_template, planner_template, fixer_template])
-
-# Save model
-json.dump(model, open(MODEL_PATH, 'w'), indent=2)
-
-print('Created 4 new agent templates:')
-print('  - template-reality-pm: Project Manager')
-print('  - template-reality-cleaner: Cleaner')
-print('  - template-reality-planner: Planner')
-print('  - template-reality-fixer: Fixer')
-print()
-print('Each template includes:')
-print('  - Node definition with capabilities')
-print('  - Agent context and spawn instructions')
-print('  - Suggested tools and infrastructure')
-print('  - Role explanation in the world')
+import mmap
+import os
+import re
+import sys
+from pathlib import Path
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; stdlib json is the fallback
+    orjson = None
+
+
+def _loads(data):
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _dumps(obj, pretty=False):
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if pretty else 0)
+    if pretty:
+        return json.dumps(obj, indent=2).encode('utf-8')
+    return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+
+
+MODEL_PATH = Path(__file__).parent / 'model' / 'sketch.json'
+
+# The PM, Cleaner, Planner and Fixer agent templates, as JSON data
+TEMPLATES_PATH = Path(__file__).with_name('agent_templates.json')
+TEMPLATES = tuple(_loads(TEMPLATES_PATH.read_bytes()))
+
+
+def _templates_fragment(templates, pretty):
+    """``templates`` as one encoded array, outer brackets stripped.
+
+    Pretty output is indented one level deeper, to sit inside the model's
+    "nodes" array.
+    """
+    if pretty:
+        return _dumps(templates, pretty=True).replace(b'\n', b'\n  ')[1:-1].strip()
+    return _dumps(templates)[1:-1]
+
+
+# String tokens (group 2 set when the string is an object key) and brackets.
+# Everything else in the JSON is irrelevant to finding the nodes array.
+_TOKEN = re.compile(rb'("(?:[^"\\]|\\.)*")(\s*:)?|[\[\]{}]')
+_EMPTY_ARRAY = re.compile(rb'\[\s*\]')
+# Ids of template nodes already in the model, found without parsing it
+_TEMPLATE_ID = re.compile(rb'"id"\s*:\s*"(template-reality-[a-z]+)"')
+
+
+def _nodes_array_bounds(raw):
+    """Offsets of the "[" and "]" around the model's top-level "nodes" array.
+
+    Only string and bracket tokens are scanned, so brackets inside string
+    values and "nodes" keys of nested objects are skipped.
+    """
+    depth = 0
+    nodes_key = False
+    start = None
+    for m in _TOKEN.finditer(raw):
+        if m.group(1) is not None:
+            nodes_key = depth == 1 and m.group(2) is not None and m.group(1) == b'"nodes"'
+            continue
+        if raw[m.start()] in b'[{':
+            depth += 1
+            if nodes_key and raw[m.start()] == ord('['):
+                start = m.start()
+                nodes_depth = depth
+            nodes_key = False
+        else:
+            if start is not None and depth == nodes_depth:
+                return start, m.start()
+            depth -= 1
+    raise ValueError(f'no top-level "nodes" array in {MODEL_PATH}')
+
+
+def missing_templates(raw):
+    """The templates whose ids do not appear as a node id in ``raw``."""
+    present = {m.decode() for m in _TEMPLATE_ID.findall(raw)}
+    return tuple(t for t in TEMPLATES if t['id'] not in present)
+
+
+def splice_point(raw, templates=TEMPLATES):
+    """Where and what to insert to append ``templates`` to the "nodes" array.
+
+    Returns the offset into ``raw`` and the bytes to insert there. Only the
+    template bytes are encoded, in a single pass; the rest of the model is
+    copied through untouched instead of being parsed and re-serialized.
+    Pretty files get the templates indented to match.
+    """
+    start, end = _nodes_array_bounds(raw)
+    # Insert right after the last element, before the whitespace ahead of "]"
+    at = end
+    while raw[at - 1] in b' \t\r\n':
+        at -= 1
+    if _EMPTY_ARRAY.match(raw, start):
+        at = start + 1
+
+    # One encoder pass over all the templates, in the file's own format
+    if raw[end - 1] in b' \t\r\n':
+        fragment = b',\n    ' + _templates_fragment(templates, pretty=True)
+    else:
+        fragment = b',' + _templates_fragment(templates, pretty=False)
+    if at == start + 1:
+        fragment = fragment[1:]
+    return at, fragment
+
+
+# Add templates to model without parsing it. The model is memory-mapped and
+# streamed into a temp file around the insertion point, so it is never read
+# into (or copied within) the heap; the temp file is swapped in afterwards so
+# a crash mid-write never truncates sketch.json.
+tmp_path = MODEL_PATH.with_suffix('.json.tmp')
+with open(MODEL_PATH, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as raw:
+    # Re-runs add nothing: only templates not already in the model are spliced in
+    new_templates = missing_templates(raw)
+    if not new_templates:
+        print('All 4 agent templates already present; skipping write')
+        sys.exit(0)
+
+    at, fragment = splice_point(raw, new_templates)
+    with memoryview(raw) as view, open(tmp_path, 'wb') as out:
+        out.write(view[:at])
+        out.write(fragment)
+        out.write(view[at:])
+# Replaced only once the map is closed; Windows refuses while it is open
+os.replace(tmp_path, MODEL_PATH)
+
+# Closing report; the fixed part is one constant, the whole goes out in one write
+_TEMPLATE_CONTENTS = ('\n'
+                      'Each template includes:\n'
+                      '  - Node definition with capabilities\n'
+                      '  - Agent context and spawn instructions\n'
+                      '  - Suggested tools and infrastructure\n'
+                      '  - Role explanation in the world\n')
+sys.stdout.write(''.join([
+    f'Created {len(new_templates)} new agent templates:\n',
+    *(f"  - {template['id']}: {template['steps']['1_define_node']['template']['label']}\n"
+      for template in new_templates),
+    _TEMPLATE_CONTENTS,
+]))
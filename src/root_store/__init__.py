@@ -5,16 +5,61 @@ Local-first backend for the Root model:
 - Maintain a derived SQLite index for fast query and reverse lookups
 - Apply model Changes safely with enforcement
 - Run audits/checks and record evidence back into the model
+
+The public names below are imported from their submodules on first access
+(PEP 562), so importing the package for one function does not load them all.
+``save_exec`` is the exception: the function shares its submodule's name, and
+importing ``root_store.save_exec`` would bind the submodule over a lazily
+cached function, so it is bound eagerly instead.
 """
 
-from .loader import load_merged_model, load_merged_models, discover_model_files
-from .index import rebuild_index, rebuild_index_multi, open_db
-from .query import QueryEngine
-from .writer import apply_change
-from .audits import run_audit_root_store_index_consistency, run_audit_root_store_attachment_closure
-from .translate import render_human_state, write_human_state
-from .registry import discover_model_roots, ModelRoot
-from .move import move_nodes_to_file, compute_move_closure, MoveSummary
-from .delete import delete_nodes, compute_delete_closure, resolve_source_paths, DeleteResult
-from .integration import verbal_save, verbal_delete, SaveResult
+import importlib
+
+# The package's JSON backend, picked once (see _json.py)
+from ._json import dumps as json_dumps, loads as json_loads
+
+# Bound now so the package attribute is the function, not the submodule
 from .save_exec import save_exec, SaveExecResult
+
+# Public name -> submodule that defines it
+_LAZY = {
+    "load_merged_model": "loader",
+    "load_merged_models": "loader",
+    "discover_model_files": "loader",
+    "rebuild_index": "index",
+    "rebuild_index_multi": "index",
+    "open_db": "index",
+    "QueryEngine": "query",
+    "apply_change": "writer",
+    "run_audit_root_store_index_consistency": "audits",
+    "run_audit_root_store_attachment_closure": "audits",
+    "render_human_state": "translate",
+    "write_human_state": "translate",
+    "discover_model_roots": "registry",
+    "ModelRoot": "registry",
+    "move_nodes_to_file": "move",
+    "compute_move_closure": "move",
+    "MoveSummary": "move",
+    "delete_nodes": "delete",
+    "compute_delete_closure": "delete",
+    "resolve_source_paths": "delete",
+    "DeleteResult": "delete",
+    "verbal_save": "integration",
+    "verbal_delete": "integration",
+    "SaveResult": "integration",
+}
+
+__all__ = ["json_dumps", "json_loads", *_LAZY, "save_exec", "SaveExecResult"]
+
+
+def __getattr__(name):
+    module_name = _LAZY.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | _LAZY.keys())
@@ -0,0 +1,66 @@
+"""JSON backend for root_store: orjson, else ujson, else the stdlib.
+
+The backend is picked once, at import. ``loads`` accepts str or bytes;
+``dumps`` returns str (ready for ``Path.write_text`` or a SQLite TEXT column),
+leaves non-ASCII text unescaped and, with ``indent=True``, indents by two
+spaces. ``dumpb`` is the same as UTF-8 bytes, for ``Path.write_bytes``; with
+orjson it skips the decode/encode round trip.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # optional; fall back to ujson, then the stdlib
+    orjson = None
+
+if orjson is not None:
+    BACKEND = "orjson"
+
+    def loads(data: Union[str, bytes]) -> Any:
+        return orjson.loads(data)
+
+    def dumpb(obj: Any, indent: bool = False) -> bytes:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(obj, option=option)
+
+    def dumps(obj: Any, indent: bool = False) -> str:
+        return dumpb(obj, indent).decode("utf-8")
+
+else:
+    try:
+        import ujson
+    except ImportError:
+        ujson = None
+
+    if ujson is not None:
+        BACKEND = "ujson"
+
+        def loads(data: Union[str, bytes]) -> Any:
+            return ujson.loads(data)
+
+        def dumps(obj: Any, indent: bool = False) -> str:
+            return ujson.dumps(
+                obj,
+                indent=2 if indent else 0,
+                ensure_ascii=False,
+                escape_forward_slashes=False,
+            )
+
+    else:
+        import json
+
+        BACKEND = "json"
+
+        def loads(data: Union[str, bytes]) -> Any:
+            return json.loads(data)
+
+        def dumps(obj: Any, indent: bool = False) -> str:
+            if indent:
+                return json.dumps(obj, indent=2, ensure_ascii=False)
+            return json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
+
+    def dumpb(obj: Any, indent: bool = False) -> bytes:
+        return dumps(obj, indent).encode("utf-8")
@@ -7,7 +7,7 @@ from pathlib import Path
 from typing import Any, Dict
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ApiConfig:
     root_model_path: Path
 
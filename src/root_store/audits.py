@@ -1,13 +1,16 @@
 from __future__ import annotations
 
-import json
+import functools
+import hashlib
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Callable, Dict
+from typing import Any, Callable, Dict, Iterable
 
-from .index import rebuild_index, open_db
-from .query import QueryEngine
-from .loader import discover_model_files, load_merged_model
+from ._json import dumpb as _json_dumpb, dumps as _json_dumps, loads as _json_loads
+from .loader import LoadedGraph, discover_model_files, load_merged_model
 from .writeback import (
     apply_node_updates,
     read_json as _read_json_file,
@@ -19,6 +22,65 @@ def _utc_now() -> str:
     return datetime.now(timezone.utc).replace(microsecond=0).isoformat().replace("+00:00", "Z")
 
 
+# State of the audit call in progress on this thread; see _audit_scoped.
+_audit_state = threading.local()
+
+
+def _audit_scoped(fn: Callable[..., Dict[str, Any]]) -> Callable[..., Dict[str, Any]]:
+    """Share one merged graph per model and one timestamp across an audit call.
+
+    The outermost audit opens the scope; audits it runs (e.g. the store
+    sub-audit of the compliance audit) reuse the same graph, `now` and
+    resolved model paths. The
+    scope is dropped when the outermost audit returns, so nothing is reused
+    across separate audit runs.
+    """
+
+    @functools.wraps(fn)
+    def wrapper(*args: Any, **kwargs: Any) -> Dict[str, Any]:
+        if getattr(_audit_state, "graphs", None) is not None:
+            return fn(*args, **kwargs)
+        _audit_state.graphs = {}
+        _audit_state.resolved = {}
+        _audit_state.now = _utc_now()
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            _audit_state.graphs = None
+            _audit_state.resolved = None
+            _audit_state.now = None
+
+    return wrapper
+
+
+def _audit_now() -> str:
+    now = getattr(_audit_state, "now", None)
+    return now if now is not None else _utc_now()
+
+
+def _resolved_root(root_model_path: Path) -> str:
+    """`root_model_path` resolved, as posix; resolved once per audit scope."""
+
+    resolved = getattr(_audit_state, "resolved", None)
+    if resolved is None:
+        return root_model_path.resolve().as_posix()
+    root_file = resolved.get(root_model_path)
+    if root_file is None:
+        root_file = resolved[root_model_path] = root_model_path.resolve().as_posix()
+    return root_file
+
+
+def _load_merged(root_model_path: Path) -> LoadedGraph:
+    graphs = getattr(_audit_state, "graphs", None)
+    if graphs is None:
+        return load_merged_model(root_model_path)
+    key = _resolved_root(root_model_path)
+    graph = graphs.get(key)
+    if graph is None:
+        graph = graphs[key] = load_merged_model(root_model_path)
+    return graph
+
+
 def _read_json(path: Path) -> Dict[str, Any]:
     return _read_json_file(path)
 
@@ -56,6 +118,31 @@ def _suggest_spawnie_shell_command(packet_path: Path) -> str:
     )
 
 
+_SCREAM_EVIDENCE_MAX_BYTES = 4 * 1024
+
+
+def _prune_for_scream(node: Dict[str, Any] | None) -> Dict[str, Any] | None:
+    """A shallow copy of `node` with oversized `evidence` replaced by a stub.
+
+    Evidence from earlier runs can nest whole result trees; a packet only needs
+    to show that it was there, so anything over 4 KiB encoded is elided.
+    """
+
+    if not isinstance(node, dict) or "evidence" not in node:
+        return node
+    ev = node["evidence"]
+    size = len(_json_dumpb(ev))
+    if size <= _SCREAM_EVIDENCE_MAX_BYTES:
+        return node
+    pruned = dict(node)
+    pruned["evidence"] = {
+        "_elided": True,
+        "keys": list(ev.keys()) if isinstance(ev, dict) else None,
+        "bytes": size,
+    }
+    return pruned
+
+
 def _write_scream_packet(
     *,
     root_model_path: Path,
@@ -65,10 +152,12 @@ def _write_scream_packet(
     now: str,
 ) -> Path:
     # Use the merged model view so scream packets still work after nodes move into submodels.
-    graph = load_merged_model(root_model_path)
-    top = graph.nodes.get("reality-seed")
-    audit = graph.nodes.get(audit_id)
-    checks = {cid: graph.nodes.get(cid) for cid in check_ids}
+    graph = _load_merged(root_model_path)
+    # Embedded nodes keep their fields but not bulky evidence from earlier runs;
+    # this run's evidence is in `results`.
+    top = _prune_for_scream(graph.nodes.get("reality-seed"))
+    audit = _prune_for_scream(graph.nodes.get(audit_id))
+    checks = {cid: _prune_for_scream(graph.nodes.get(cid)) for cid in check_ids}
 
     packet = {
         "kind": "root_store.scream_packet",
@@ -84,24 +173,216 @@ def _write_scream_packet(
     out_dir = _scream_packet_dir()
     out_dir.mkdir(parents=True, exist_ok=True)
     out_path = out_dir / f"{now.replace(':', '').replace('-', '').replace('T', '_')}-{audit_id}.json"
-    _write_json(out_path, packet)
+    # Packets can still be large: encode straight to bytes
+    # (no str round trip) and write the trailing newline separately (no copy).
+    with open(out_path, "wb") as f:
+        f.write(_json_dumpb(packet, indent=True))
+        f.write(b"\n")
     return out_path
 
 
+def _apply_check(n: Dict[str, Any], *, ok: bool, evidence: Dict[str, Any], now: str) -> None:
+    n["status"] = "pass" if ok else "fail"
+    n["result"] = "pass" if ok else "fail"
+    n["last_run"] = now
+    n["evidence"] = evidence
+
+
+def _apply_audit(
+    n: Dict[str, Any],
+    *,
+    ok: bool,
+    finding: str,
+    results: Dict[str, Any],
+    now: str,
+    scream: Dict[str, str] | None = None,
+) -> None:
+    n["status"] = "pass" if ok else "fail"
+    n["last_run"] = now
+    n["findings"] = [] if ok else [finding]
+    n["evidence"] = {"results": results}
+    if scream is not None:
+        n["evidence"]["scream"] = dict(scream)
+
+
+def _record_audit_result(
+    *,
+    root_model_path: Path,
+    graph: LoadedGraph,
+    audit_id: str,
+    ok: bool,
+    finding: str,
+    results: Dict[str, Any],
+    checks: list[tuple[str, bool, Dict[str, Any]]],
+    now: str,
+) -> None:
+    """Write an audit's outcome back into the model.
+
+    `checks` lists `(check_id, ok, evidence)` for the audit's Check nodes. On
+    failure a scream packet is written first and linked from the audit node.
+    """
+
+    scream: Dict[str, str] | None = None
+    if not ok:
+        packet_path = _write_scream_packet(
+            root_model_path=root_model_path,
+            audit_id=audit_id,
+            check_ids=[check_id for check_id, _, _ in checks],
+            results=results,
+            now=now,
+        )
+        scream = {
+            "packet": str(packet_path),
+            "suggested_spawnie_shell": _suggest_spawnie_shell_command(packet_path),
+        }
+
+    updates: Dict[str, Callable[[Dict[str, Any]], None]] = {
+        check_id: functools.partial(_apply_check, ok=check_ok, evidence=evidence, now=now)
+        for check_id, check_ok, evidence in checks
+    }
+    updates[audit_id] = functools.partial(
+        _apply_audit, ok=ok, finding=finding, results=results, now=now, scream=scream
+    )
+    apply_node_updates(graph=graph, default_model_file=root_model_path, updates=updates)
+
+
 def _as_bool(x: Any) -> bool:
     return bool(x)
 
 
-def _sha256(path: Path) -> str:
-    import hashlib
+# Upper bound on threads hashing Module files; reads and hashlib release the GIL.
+_HASH_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+# Read buffer and an empty hasher for _sha256, one each per thread and reused
+# across files: every file starts from seed.copy() rather than a new context.
+_SHA256_BUF_SIZE = 1 << 20
+_sha256_local = threading.local()
+
 
-    h = hashlib.sha256()
-    with open(path, "rb") as f:
-        for chunk in iter(lambda: f.read(65536), b""):
-            h.update(chunk)
+def _sha256(path: str | Path) -> str:
+    buf = getattr(_sha256_local, "buf", None)
+    if buf is None:
+        buf = _sha256_local.buf = bytearray(_SHA256_BUF_SIZE)
+        _sha256_local.seed = hashlib.sha256()
+    view = memoryview(buf)
+
+    h = _sha256_local.seed.copy()
+    with open(path, "rb", buffering=0) as f:
+        while n := f.readinto(buf):
+            h.update(view[:n])
     return h.hexdigest()
 
 
+def _sha256_cache_path() -> Path:
+    return Path(__file__).parent / "hash_cache.json"
+
+
+def _load_sha256_cache(path: Path) -> Dict[str, Dict[str, Any]]:
+    try:
+        cache = _read_json(path)
+    except Exception:
+        return {}
+    return cache if isinstance(cache, dict) else {}
+
+
+def _save_sha256_cache(path: Path, cache: Dict[str, Dict[str, Any]]) -> None:
+    tmp = path.with_suffix(".json.tmp")
+    tmp.write_text(_json_dumps(cache), encoding="utf-8")
+    os.replace(tmp, path)
+
+
+def _merge_sha256_cache(
+    cache: Dict[str, Dict[str, Any]],
+    fresh: Dict[str, Dict[str, Any]],
+) -> Dict[str, Dict[str, Any]]:
+    """`fresh` plus the entries of `cache` it does not cover whose files still exist.
+
+    The cache is shared by every audited root, so entries outside this run's
+    file set are kept for the next audit of their own root; only files that
+    are gone are dropped.
+    """
+
+    kept = {k: v for k, v in cache.items() if k not in fresh and os.path.exists(k)}
+    kept.update(fresh)
+    return kept
+
+
+def _sha256_cached(
+    path: str | Path,
+    cache: Dict[str, Dict[str, Any]],
+    fresh: Dict[str, Dict[str, Any]],
+    st: os.stat_result | None = None,
+) -> str:
+    """SHA-256 of `path`, reusing `cache` while its size and mtime are unchanged.
+
+    The entry used (cached or recomputed) is recorded in `fresh`, which thus
+    ends up holding only files that still exist and are still hashed. Pass
+    `st` if the caller has already stat'ed `path`.
+    """
+
+    if st is None:
+        st = os.stat(path)
+    key = str(path)
+    entry = cache.get(key)
+    if not (
+        isinstance(entry, dict)
+        and entry.get("mtime_ns") == st.st_mtime_ns
+        and entry.get("size") == st.st_size
+        and isinstance(entry.get("sha256"), str)
+    ):
+        entry = {"mtime_ns": st.st_mtime_ns, "size": st.st_size, "sha256": _sha256(path)}
+    fresh[key] = entry
+    return entry["sha256"]
+
+
+def _build_edge_index(edges: list[Dict[str, Any]]) -> Dict[tuple[str, str], set[str]]:
+    """Map (edge type, from id) to the set of `to` ids, in one pass over `edges`."""
+    idx: Dict[tuple[str, str], set[str]] = {}
+    for e in edges:
+        if not isinstance(e, dict):
+            continue
+        et = e.get("type")
+        frm = e.get("from")
+        if not (isinstance(et, str) and isinstance(frm, str)):
+            continue
+        tos = idx.setdefault((et, frm), set())
+        to = e.get("to")
+        if isinstance(to, str):
+            tos.add(to)
+    return idx
+
+
+def _group_nodes_by_type(nodes: Dict[str, Dict[str, Any]]) -> Dict[str, list[tuple[str, Dict[str, Any]]]]:
+    """Bucket `(id, node)` pairs by node type, in graph order, in one pass."""
+    by_type: Dict[str, list[tuple[str, Dict[str, Any]]]] = {}
+    for nid, n in nodes.items():
+        t = n.get("type")
+        if isinstance(t, str):
+            by_type.setdefault(t, []).append((nid, n))
+    return by_type
+
+
+def _scan_parent_dirs(paths: Iterable[str]) -> Dict[str, Dict[str, os.DirEntry[str]]]:
+    """Map each parent directory of `paths` to its entries by name, one scandir each.
+
+    `DirEntry.stat()` caches its result, and on Windows is filled in by the
+    listing itself. A directory that cannot be listed maps to no entries.
+    """
+
+    scanned: Dict[str, Dict[str, os.DirEntry[str]]] = {}
+    for path in paths:
+        head = os.path.dirname(path)
+        if head in scanned:
+            continue
+        try:
+            with os.scandir(head) as it:
+                scanned[head] = {e.name: e for e in it}
+        except OSError:
+            scanned[head] = {}
+    return scanned
+
+
+@functools.lru_cache(maxsize=None)
 def _model_base_dir_for_provenance_file(prov_file: str) -> Path:
     # Convention: model file lives at <base>/model/sketch.json
     # So base dir is parent.parent.
@@ -112,6 +393,7 @@ def _model_base_dir_for_provenance_file(prov_file: str) -> Path:
         return p.parent
 
 
+@_audit_scoped
 def run_audit_root_compliance(root_model_path: Path) -> Dict[str, Any]:
     """Run the modeled audit `audit-root-compliance`.
 
@@ -126,23 +408,24 @@ def run_audit_root_compliance(root_model_path: Path) -> Dict[str, Any]:
     - audits are runnable (at least one runner-backed audit executed and wrote evidence)
     """
 
-    now = _utc_now()
-    graph = load_merged_model(root_model_path)
+    now = _audit_now()
+    graph = _load_merged(root_model_path)
 
     nodes = graph.nodes
     edges = graph.edges
+    # Both node checks below look at a single type; bucket once instead of scanning all nodes twice.
+    by_type = _group_nodes_by_type(nodes)
 
     def node(nid: str) -> Dict[str, Any] | None:
         return nodes.get(nid)
 
     # Top realities: Reality nodes in the root model (provenance == root model file)
-    root_file = str(root_model_path.resolve().as_posix())
+    root_file = _resolved_root(root_model_path)
+    prov_by_id = graph.provenance_by_node_id
     top_realities = [
         n
-        for n in nodes.values()
-        if n.get("type") == "Reality"
-        and graph.provenance_by_node_id.get(n.get("id"), None)
-        and graph.provenance_by_node_id[n.get("id")].file == root_file
+        for nid, n in by_type.get("Reality", ())
+        if (prov := prov_by_id.get(nid)) is not None and prov.file == root_file
     ]
 
     # --- Check 1: agent_context completeness ---
@@ -169,13 +452,19 @@ def run_audit_root_compliance(root_model_path: Path) -> Dict[str, Any]:
 
     # --- Check 2: hash-control coverage ---
     # For every Module node with a source.path, require source.hash and verify it.
+    # Hashes are cached by (path, mtime, size), so unchanged files are not re-read.
     hash_missing: list[str] = []
     hash_mismatch: list[dict[str, Any]] = []
     file_missing: list[str] = []
-
-    for nid, n in nodes.items():
-        if n.get("type") != "Module":
-            continue
+    hash_cache_path = _sha256_cache_path()
+    hash_cache = _load_sha256_cache(hash_cache_path)
+    fresh_hash_cache: Dict[str, Dict[str, Any]] = {}
+    to_hash: list[tuple[str, str, str, int | None]] = []
+    # Provenance files are already resolved, so module paths are joined and
+    # normalized lexically rather than realpath()'d one syscall chain per file.
+    root_base_dir = Path(root_file).parent.parent
+
+    for nid, n in by_type.get("Module", ()):
         source = n.get("source")
         if not isinstance(source, dict):
             continue
@@ -187,36 +476,84 @@ def run_audit_root_compliance(root_model_path: Path) -> Dict[str, Any]:
             hash_missing.append(nid)
             continue
 
-        prov = graph.provenance_by_node_id.get(nid)
-        base_dir = _model_base_dir_for_provenance_file(prov.file) if prov else root_model_path.parent.parent
-        full_path = (base_dir / rel).resolve()
-        if not full_path.exists():
+        prov = prov_by_id.get(nid)
+        base_dir = _model_base_dir_for_provenance_file(prov.file) if prov else root_base_dir
+        full_path = os.path.normpath(os.path.join(base_dir, rel))
+        # A recorded source.size lets a changed file be flagged from its stat alone.
+        size = source.get("size")
+        if not isinstance(size, int) or isinstance(size, bool):
+            size = None
+        to_hash.append((nid, full_path, expected, size))
+
+    # The pass above only inspects nodes; file access starts here. Each directory
+    # holding a Module file is listed once, and each file is stat'ed through its
+    # entry: a missing file is returned as None (no separate exists() call), and
+    # a size differing from source.size as (None, size), unhashed.
+    dir_entries = _scan_parent_dirs(item[1] for item in to_hash)
+
+    def _hash_one(item: tuple[str, str, str, int | None]) -> tuple[str | None, int] | None:
+        path, size = item[1], item[3]
+        head, name = os.path.split(path)
+        entry = dir_entries[head].get(name)
+        try:
+            # Names not listed (e.g. a differently-cased path on a case-insensitive
+            # filesystem) fall back to a plain stat.
+            st = entry.stat() if entry is not None else os.stat(path)
+            if size is not None and st.st_size != size:
+                return None, st.st_size
+            return _sha256_cached(path, hash_cache, fresh_hash_cache, st), st.st_size
+        except (FileNotFoundError, NotADirectoryError):
+            return None
+
+    if len(to_hash) > 1:
+        with ThreadPoolExecutor(max_workers=min(_HASH_WORKERS, len(to_hash))) as ex:
+            actuals = list(ex.map(_hash_one, to_hash))
+    else:
+        actuals = [_hash_one(item) for item in to_hash]
+
+    for (nid, full_path, expected, size), result in zip(to_hash, actuals):
+        if result is None:
             file_missing.append(nid)
             continue
-        actual = _sha256(full_path)
-        if actual != expected:
+        actual, actual_size = result
+        if actual is None:
             hash_mismatch.append(
                 {
                     "id": nid,
-                    "path": str(full_path),
+                    "path": full_path,
+                    "expected": expected,
+                    "reason": "size",
+                    "expected_size": size,
+                    "actual_size": actual_size,
+                }
+            )
+        elif actual != expected:
+            hash_mismatch.append(
+                {
+                    "id": nid,
+                    "path": full_path,
                     "expected": expected,
                     "actual": actual,
                 }
             )
 
+    merged_hash_cache = _merge_sha256_cache(hash_cache, fresh_hash_cache)
+    if merged_hash_cache != hash_cache:
+        try:
+            _save_sha256_cache(hash_cache_path, merged_hash_cache)
+        except OSError:
+            pass  # the cache is only an optimization; the audit result stands
+
     ok_hash = (len(hash_missing) == 0) and (len(hash_mismatch) == 0) and (len(file_missing) == 0)
 
     # --- Check 3: governance wiring exists ---
+    edge_index = _build_edge_index(edges)
+
     def has_edge(edge_type: str, from_id: str, to_id: str | None = None) -> bool:
-        for e in edges:
-            if e.get("type") != edge_type:
-                continue
-            if e.get("from") != from_id:
-                continue
-            if to_id is not None and e.get("to") != to_id:
-                continue
-            return True
-        return False
+        tos = edge_index.get((edge_type, from_id))
+        if tos is None:
+            return False
+        return to_id is None or to_id in tos
 
     ok_governance = (
         node("policy-aspiration-aligned-change") is not None
@@ -261,74 +598,34 @@ def run_audit_root_compliance(root_model_path: Path) -> Dict[str, Any]:
         "top_realities": [r.get("id") for r in top_realities],
     }
 
-    def _mk_check_update(ok: bool, evidence: Dict[str, Any]):
-        def _update(n: Dict[str, Any]) -> None:
-            n["status"] = "pass" if ok else "fail"
-            n["result"] = "pass" if ok else "fail"
-            n["last_run"] = now
-            n["evidence"] = evidence
-
-        return _update
-
-    audit_id = "audit-root-compliance"
-
-    def _update_audit_node(n: Dict[str, Any]) -> None:
-        n["status"] = "pass" if audit_ok else "fail"
-        n["last_run"] = now
-        n["findings"] = [] if audit_ok else ["Compliance incomplete: see checks + score"]
-        n["evidence"] = {"results": results}
-
-    updates: Dict[str, Callable[[Dict[str, Any]], None]] = {
-        "check-root-compliance-agent-context": _mk_check_update(
-            ok_agent_context, results["checks"]["agent_context"]
-        ),
-        "check-root-compliance-hash-control": _mk_check_update(ok_hash, results["checks"]["hash_control"]),
-        "check-root-compliance-governance": _mk_check_update(ok_governance, results["checks"]["governance"]),
-        "check-root-compliance-audits": _mk_check_update(ok_audits, results["checks"]["audits_runnable"]),
-        audit_id: _update_audit_node,
-    }
+    _record_audit_result(
+        root_model_path=root_model_path,
+        graph=graph,
+        audit_id="audit-root-compliance",
+        ok=audit_ok,
+        finding="Compliance incomplete: see checks + score",
+        results=results,
+        checks=[
+            ("check-root-compliance-agent-context", ok_agent_context, results["checks"]["agent_context"]),
+            ("check-root-compliance-hash-control", ok_hash, results["checks"]["hash_control"]),
+            ("check-root-compliance-governance", ok_governance, results["checks"]["governance"]),
+            ("check-root-compliance-audits", ok_audits, results["checks"]["audits_runnable"]),
+        ],
+        now=now,
+    )
+    return {"ok": audit_ok, **results}
 
-    if not audit_ok:
-        check_ids = [
-            "check-root-compliance-agent-context",
-            "check-root-compliance-hash-control",
-            "check-root-compliance-governance",
-            "check-root-compliance-audits",
-        ]
-        packet_path = _write_scream_packet(
-            root_model_path=root_model_path,
-            audit_id=audit_id,
-            check_ids=check_ids,
-            results=results,
-            now=now,
-        )
-        spawnie_cmd = _suggest_spawnie_shell_command(packet_path)
-
-        def _attach_scream(n: Dict[str, Any]) -> None:
-            ev = n.get("evidence")
-            if not isinstance(ev, dict):
-                ev = {}
-            ev.setdefault("scream", {})
-            if isinstance(ev.get("scream"), dict):
-                ev["scream"].update(
-                    {
-                        "packet": str(packet_path),
-                        "suggested_spawnie_shell": spawnie_cmd,
-                    }
-                )
-            n["evidence"] = ev
-
-        # Compose scream attachment on top of base audit update.
-        def _audit_update_with_scream(n: Dict[str, Any]) -> None:
-            _update_audit_node(n)
-            _attach_scream(n)
-
-        updates[audit_id] = _audit_update_with_scream
 
-    apply_node_updates(graph=graph, default_model_file=root_model_path, updates=updates)
-    return {"ok": audit_ok, **results}
+_MISSING_PROV_SQL = """
+SELECT
+  (SELECT json_group_array(id) FROM
+    (SELECT id FROM nodes WHERE provenance_file IS NULL OR provenance_file = '' LIMIT 20)) AS nodes,
+  (SELECT json_group_array(id) FROM
+    (SELECT id FROM edges WHERE provenance_file IS NULL OR provenance_file = '' LIMIT 20)) AS edges
+"""
 
 
+@_audit_scoped
 def run_audit_root_store_index_consistency(root_model_path: Path) -> Dict[str, Any]:
     """Run the modeled audit `audit-root-store-index-consistency`.
 
@@ -339,18 +636,24 @@ def run_audit_root_store_index_consistency(root_model_path: Path) -> Dict[str, A
     Writes results back into the Root model audit/check nodes.
     """
 
-    db_path = rebuild_index(root_model_path)
+    # SQLite and the query engine are only needed here; import them on first use
+    # so importing audits (e.g. for the other audits) stays light.
+    from .index import open_db, rebuild_index
+    from .query import QueryEngine
+
+    # Index the audit-scoped graph: the files are parsed once, and the same
+    # graph serves the write-back below (and the enclosing compliance audit).
+    graph = _load_merged(root_model_path)
+    db_path = rebuild_index(root_model_path, graph=graph)
 
     with open_db(db_path) as conn:
         q = QueryEngine(conn)
 
-        # Check 1: provenance present
-        missing_node_prov = conn.execute(
-            "SELECT id FROM nodes WHERE provenance_file IS NULL OR provenance_file = '' LIMIT 20"
-        ).fetchall()
-        missing_edge_prov = conn.execute(
-            "SELECT id FROM edges WHERE provenance_file IS NULL OR provenance_file = '' LIMIT 20"
-        ).fetchall()
+        # Check 1: provenance present. Both tables are sampled (up to 20 ids each)
+        # in one statement, with the ids aggregated into JSON arrays by SQLite.
+        row = conn.execute(_MISSING_PROV_SQL).fetchone()
+        missing_node_prov = _json_loads(row["nodes"])
+        missing_edge_prov = _json_loads(row["edges"])
         ok_prov = (len(missing_node_prov) == 0) and (len(missing_edge_prov) == 0)
 
         # Check 2: reverse lookups
@@ -363,8 +666,8 @@ def run_audit_root_store_index_consistency(root_model_path: Path) -> Dict[str, A
             "db_path": str(db_path),
             "provenance": {
                 "ok": ok_prov,
-                "missing_node_prov": [r["id"] for r in missing_node_prov],
-                "missing_edge_prov": [r["id"] for r in missing_edge_prov],
+                "missing_node_prov": missing_node_prov,
+                "missing_edge_prov": missing_edge_prov,
             },
             "reverse_lookups": {
                 "ok": ok_reverse,
@@ -374,76 +677,32 @@ def run_audit_root_store_index_consistency(root_model_path: Path) -> Dict[str, A
             },
         }
 
-    graph = load_merged_model(root_model_path)
-    now = _utc_now()
-
-    def _mk_check_update(ok: bool, evidence: Dict[str, Any]):
-        def _update(n: Dict[str, Any]) -> None:
-            n["status"] = "pass" if ok else "fail"
-            n["result"] = "pass" if ok else "fail"
-            n["last_run"] = now
-            n["evidence"] = evidence
+    now = _audit_now()
 
-        return _update
-
-    audit_id = "audit-root-store-index-consistency"
     audit_ok = ok_prov and ok_reverse
 
-    def _update_audit_node(n: Dict[str, Any]) -> None:
-        n["status"] = "pass" if audit_ok else "fail"
-        n["last_run"] = now
-        n["findings"] = [] if audit_ok else ["See failed checks"]
-        n["evidence"] = {"results": results}
-
-    updates: Dict[str, Callable[[Dict[str, Any]], None]] = {
-        "check-root-store-has-provenance": _mk_check_update(ok_prov, results["provenance"]),
-        "check-root-store-change-gate": _mk_check_update(
-            True,
-            {"ok": True, "note": "enforcement.validate_change_gate accepts merged graphs and is invoked by writer.apply_change"},
-        ),
-        "check-root-store-reverse-lookups": _mk_check_update(ok_reverse, results["reverse_lookups"]),
-        audit_id: _update_audit_node,
-    }
-
-    if not audit_ok:
-        check_ids = [
-            "check-root-store-has-provenance",
-            "check-root-store-change-gate",
-            "check-root-store-reverse-lookups",
-        ]
-        packet_path = _write_scream_packet(
-            root_model_path=root_model_path,
-            audit_id=audit_id,
-            check_ids=check_ids,
-            results=results,
-            now=now,
-        )
-        spawnie_cmd = _suggest_spawnie_shell_command(packet_path)
-
-        def _attach_scream(n: Dict[str, Any]) -> None:
-            ev = n.get("evidence")
-            if not isinstance(ev, dict):
-                ev = {}
-            ev.setdefault("scream", {})
-            if isinstance(ev.get("scream"), dict):
-                ev["scream"].update(
-                    {
-                        "packet": str(packet_path),
-                        "suggested_spawnie_shell": spawnie_cmd,
-                    }
-                )
-            n["evidence"] = ev
-
-        def _audit_update_with_scream(n: Dict[str, Any]) -> None:
-            _update_audit_node(n)
-            _attach_scream(n)
-
-        updates[audit_id] = _audit_update_with_scream
-
-    apply_node_updates(graph=graph, default_model_file=root_model_path, updates=updates)
+    _record_audit_result(
+        root_model_path=root_model_path,
+        graph=graph,
+        audit_id="audit-root-store-index-consistency",
+        ok=audit_ok,
+        finding="See failed checks",
+        results=results,
+        checks=[
+            ("check-root-store-has-provenance", ok_prov, results["provenance"]),
+            (
+                "check-root-store-change-gate",
+                True,
+                {"ok": True, "note": "enforcement.validate_change_gate accepts merged graphs and is invoked by writer.apply_change"},
+            ),
+            ("check-root-store-reverse-lookups", ok_reverse, results["reverse_lookups"]),
+        ],
+        now=now,
+    )
     return {"ok": audit_ok, **results}
 
 
+@_audit_scoped
 def run_audit_root_store_attachment_closure(root_model_path: Path) -> Dict[str, Any]:
     """Ensure structural attachments are co-located (move-safe).
 
@@ -454,10 +713,11 @@ def run_audit_root_store_attachment_closure(root_model_path: Path) -> Dict[str,
     This is the enforcement layer that makes partial moves scream.
     """
 
-    now = _utc_now()
-    graph = load_merged_model(root_model_path)
+    now = _audit_now()
+    graph = _load_merged(root_model_path)
 
-    prov_nodes = graph.provenance_by_node_id
+    # Node id -> defining file, flattened once for the edge loop below
+    prov_by_id: dict[str, str] = {nid: p.file for nid, p in graph.provenance_by_node_id.items()}
 
     def _normalize_ref_path(ref: str) -> Path:
         # Accept both C:/seed/... and relative paths.
@@ -466,7 +726,9 @@ def run_audit_root_store_attachment_closure(root_model_path: Path) -> Dict[str,
         return Path(ref)
 
     # Parent mountpoints can legitimately CONTAIN children defined in their referenced submodel file(s).
+    # Several mountpoints may reference the same submodel; discover each one once.
     mount_allowed_files: dict[str, set[str]] = {}
+    allowed_by_ref: dict[Path, set[str]] = {}
     for nid, n in graph.nodes.items():
         if not isinstance(n, dict):
             continue
@@ -474,14 +736,12 @@ def run_audit_root_store_attachment_closure(root_model_path: Path) -> Dict[str,
         if not (isinstance(mm, dict) and isinstance(mm.get("_ref"), str)):
             continue
         ref = _normalize_ref_path(mm["_ref"]).resolve()
-        if ref.exists():
-            allowed = {p.as_posix() for p in discover_model_files([ref])}
+        allowed = allowed_by_ref.get(ref)
+        if allowed is None and ref.exists():
+            allowed = allowed_by_ref[ref] = {p.as_posix() for p in discover_model_files([ref])}
+        if allowed is not None:
             mount_allowed_files[nid] = allowed
 
-    def prov_file(node_id: str) -> str | None:
-        p = prov_nodes.get(node_id)
-        return None if p is None else p.file
-
     has_check_violations: list[dict[str, Any]] = []
     contains_violations: list[dict[str, Any]] = []
 
@@ -494,34 +754,34 @@ def run_audit_root_store_attachment_closure(root_model_path: Path) -> Dict[str,
         if not (isinstance(frm, str) and isinstance(to, str)):
             continue
 
+        if et != "HAS_CHECK" and et != "CONTAINS":
+            continue
+        pf = prov_by_id.get(frm)
+        pt = prov_by_id.get(to)
+        if not (pf and pt and pf != pt):
+            continue
+
         if et == "HAS_CHECK":
-            pf = prov_file(frm)
-            pt = prov_file(to)
-            if pf and pt and pf != pt:
-                has_check_violations.append(
-                    {
-                        "audit": frm,
-                        "check": to,
-                        "audit_file": pf,
-                        "check_file": pt,
-                    }
-                )
-
-        if et == "CONTAINS":
-            pf = prov_file(frm)
-            pt = prov_file(to)
-            if pf and pt and pf != pt:
-                allowed = mount_allowed_files.get(frm)
-                if isinstance(allowed, set) and pt in allowed:
-                    continue
-                contains_violations.append(
-                    {
-                        "parent": frm,
-                        "child": to,
-                        "parent_file": pf,
-                        "child_file": pt,
-                    }
-                )
+            has_check_violations.append(
+                {
+                    "audit": frm,
+                    "check": to,
+                    "audit_file": pf,
+                    "check_file": pt,
+                }
+            )
+        else:
+            allowed = mount_allowed_files.get(frm)
+            if isinstance(allowed, set) and pt in allowed:
+                continue
+            contains_violations.append(
+                {
+                    "parent": frm,
+                    "child": to,
+                    "parent_file": pf,
+                    "child_file": pt,
+                }
+            )
 
     ok_has_check = len(has_check_violations) == 0
     ok_contains = len(contains_violations) == 0
@@ -534,66 +794,17 @@ def run_audit_root_store_attachment_closure(root_model_path: Path) -> Dict[str,
         }
     }
 
-    audit_id = "audit-root-store-attachment-closure"
-
-    def _mk_check_update(ok: bool, evidence: Dict[str, Any]):
-        def _update(n: Dict[str, Any]) -> None:
-            n["status"] = "pass" if ok else "fail"
-            n["result"] = "pass" if ok else "fail"
-            n["last_run"] = now
-            n["evidence"] = evidence
-
-        return _update
-
-    def _update_audit_node(n: Dict[str, Any]) -> None:
-        n["status"] = "pass" if audit_ok else "fail"
-        n["last_run"] = now
-        n["findings"] = [] if audit_ok else ["Attachment closure violated: see checks"]
-        n["evidence"] = {"results": results}
-
-    updates: Dict[str, Callable[[Dict[str, Any]], None]] = {
-        "check-root-store-has_check-colocated": _mk_check_update(
-            ok_has_check, results["checks"]["has_check_colocated"]
-        ),
-        "check-root-store-contains-colocated": _mk_check_update(
-            ok_contains, results["checks"]["contains_colocated"]
-        ),
-        audit_id: _update_audit_node,
-    }
-
-    if not audit_ok:
-        check_ids = [
-            "check-root-store-has_check-colocated",
-            "check-root-store-contains-colocated",
-        ]
-        packet_path = _write_scream_packet(
-            root_model_path=root_model_path,
-            audit_id=audit_id,
-            check_ids=check_ids,
-            results=results,
-            now=now,
-        )
-        spawnie_cmd = _suggest_spawnie_shell_command(packet_path)
-
-        def _attach_scream(n: Dict[str, Any]) -> None:
-            ev = n.get("evidence")
-            if not isinstance(ev, dict):
-                ev = {}
-            ev.setdefault("scream", {})
-            if isinstance(ev.get("scream"), dict):
-                ev["scream"].update(
-                    {
-                        "packet": str(packet_path),
-                        "suggested_spawnie_shell": spawnie_cmd,
-                    }
-                )
-            n["evidence"] = ev
-
-        def _audit_update_with_scream(n: Dict[str, Any]) -> None:
-            _update_audit_node(n)
-            _attach_scream(n)
-
-        updates[audit_id] = _audit_update_with_scream
-
-    apply_node_updates(graph=graph, default_model_file=root_model_path, updates=updates)
+    _record_audit_result(
+        root_model_path=root_model_path,
+        graph=graph,
+        audit_id="audit-root-store-attachment-closure",
+        ok=audit_ok,
+        finding="Attachment closure violated: see checks",
+        results=results,
+        checks=[
+            ("check-root-store-has_check-colocated", ok_has_check, results["checks"]["has_check_colocated"]),
+            ("check-root-store-contains-colocated", ok_contains, results["checks"]["contains_colocated"]),
+        ],
+        now=now,
+    )
     return {"ok": audit_ok, **results}
@@ -11,18 +11,22 @@ Deletion is recursive ("turtles all the way down"):
 
 from __future__ import annotations
 
+import os
 import shutil
+import time
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Set
+from typing import Any, Deque, Dict, Iterable, List, Set
 
 from .loader import load_merged_model
 from .writeback import read_json, write_json, resolve_node_model_file
 
 
 def _utc_now() -> str:
-    return datetime.now(timezone.utc).replace(microsecond=0).isoformat().replace("+00:00", "Z")
+    # Whole seconds, formatted straight from the epoch time
+    return time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
 
 
 def _node_type(graph: Any, node_id: str) -> str | None:
@@ -33,26 +37,55 @@ def _node_type(graph: Any, node_id: str) -> str | None:
     return None
 
 
-def _out_edges(graph: Any, *, edge_type: str, from_id: str) -> Iterable[Dict[str, Any]]:
-    for e in getattr(graph, "edges", []):
-        if not isinstance(e, dict):
-            continue
-        if e.get("type") != edge_type:
-            continue
-        if e.get("from") != from_id:
-            continue
-        yield e
+def _build_edge_index(graph: Any) -> Dict[str, Dict[str, List[Any]]]:
+    """Index `graph.edges` once for the closure walk and the edge sweep.
+
+    - "CONTAINS_out": parent id -> child ids
+    - "HAS_CHECK_out": audit id -> check ids
+    - "HAS_CHECK_in": check id -> audit ids
+    - "touching": node id -> indexes of every edge with that node as an endpoint
+
+    The index is cached on the graph, which is loaded fresh for each delete.
+    """
+
+    idx = getattr(graph, "_edge_index", None)
+    if idx is not None:
+        return idx
 
+    contains_out: Dict[str, List[Any]] = defaultdict(list)
+    has_check_out: Dict[str, List[Any]] = defaultdict(list)
+    has_check_in: Dict[str, List[Any]] = defaultdict(list)
+    touching: Dict[str, List[Any]] = defaultdict(list)
 
-def _in_edges(graph: Any, *, edge_type: str, to_id: str) -> Iterable[Dict[str, Any]]:
-    for e in getattr(graph, "edges", []):
+    for i, e in enumerate(getattr(graph, "edges", [])):
         if not isinstance(e, dict):
             continue
-        if e.get("type") != edge_type:
-            continue
-        if e.get("to") != to_id:
-            continue
-        yield e
+        from_id = e.get("from")
+        to_id = e.get("to")
+        et = e.get("type")
+        if isinstance(from_id, str):
+            if et == "CONTAINS":
+                contains_out[from_id].append(to_id)
+            elif et == "HAS_CHECK":
+                has_check_out[from_id].append(to_id)
+            touching[from_id].append(i)
+        if isinstance(to_id, str):
+            if et == "HAS_CHECK":
+                has_check_in[to_id].append(from_id)
+            if to_id != from_id:
+                touching[to_id].append(i)
+
+    idx = {
+        "CONTAINS_out": contains_out,
+        "HAS_CHECK_out": has_check_out,
+        "HAS_CHECK_in": has_check_in,
+        "touching": touching,
+    }
+    try:
+        graph._edge_index = idx
+    except AttributeError:
+        pass
+    return idx
 
 
 def _model_base_dir_for_provenance_file(prov_file: str) -> Path:
@@ -79,11 +112,12 @@ def compute_delete_closure(graph: Any, seed_node_ids: Iterable[str]) -> Set[str]
     deletes children, deleting an Audit always deletes its Checks.
     """
 
-    queue: List[str] = [nid for nid in seed_node_ids if isinstance(nid, str)]
+    idx = _build_edge_index(graph)
+    queue: Deque[str] = deque(nid for nid in seed_node_ids if isinstance(nid, str))
     seen: Set[str] = set()
 
     while queue:
-        nid = queue.pop(0)
+        nid = queue.popleft()
         if nid in seen:
             continue
         seen.add(nid)
@@ -92,22 +126,19 @@ def compute_delete_closure(graph: Any, seed_node_ids: Iterable[str]) -> Set[str]
 
         # Audit -> Check via HAS_CHECK
         if t == "Audit":
-            for e in _out_edges(graph, edge_type="HAS_CHECK", from_id=nid):
-                to_id = e.get("to")
+            for to_id in idx["HAS_CHECK_out"].get(nid, ()):
                 if isinstance(to_id, str) and to_id not in seen:
                     queue.append(to_id)
 
         # Check <- Audit via HAS_CHECK (bidirectional)
         if t == "Check":
-            for e in _in_edges(graph, edge_type="HAS_CHECK", to_id=nid):
-                from_id = e.get("from")
+            for from_id in idx["HAS_CHECK_in"].get(nid, ()):
                 if isinstance(from_id, str) and from_id not in seen:
                     queue.append(from_id)
 
         # Reality/Subsystem -> children via CONTAINS
         if t in {"Reality", "Subsystem"}:
-            for e in _out_edges(graph, edge_type="CONTAINS", from_id=nid):
-                to_id = e.get("to")
+            for to_id in idx["CONTAINS_out"].get(nid, ()):
                 if isinstance(to_id, str) and to_id not in seen:
                     queue.append(to_id)
 
@@ -121,7 +152,8 @@ def resolve_source_paths(
 ) -> Dict[str, Path]:
     """Resolve source file/folder paths for nodes.
 
-    Returns a mapping from node_id to the full resolved path of its source.
+    Returns a mapping from node_id to the full resolved path of its source;
+    a source that is itself a symlink maps to the link, not its target.
     Only includes nodes that have a source.path defined.
     """
 
@@ -148,12 +180,131 @@ def resolve_source_paths(
         else:
             base_dir = root_model_path.parent.parent
 
-        full_path = (base_dir / rel_path).resolve()
+        # Keep a trailing symlink as-is: resolving it would aim the delete
+        # at the link's target, which may lie outside the tree.
+        full_path = base_dir / rel_path
+        if full_path.name in ("", ".."):
+            full_path = full_path.resolve()
+        else:
+            full_path = full_path.parent.resolve() / full_path.name
         result[nid] = full_path
 
     return result
 
 
+# Upper bound on threads removing source paths; deletes are syscall-bound.
+_DELETE_WORKERS = 64
+
+
+def _outermost_paths(paths: Iterable[Path]) -> List[Path]:
+    """The distinct `paths`, sorted, minus any inside another one.
+
+    A nested path goes with its ancestor's rmtree; deleting both at once from
+    different threads would race.
+    """
+
+    kept: List[Path] = []
+    # Sorted, each path's descendants directly follow it
+    for p in sorted(set(paths)):
+        if kept and (p == kept[-1] or kept[-1] in p.parents):
+            continue
+        kept.append(p)
+    return kept
+
+
+# Files unlinked per pool task; each batch shares one parent directory.
+_UNLINK_BATCH = 256
+# unlinkat(2) relative to an open directory fd skips the per-file path walk.
+_UNLINK_AT = os.unlink in os.supports_dir_fd
+
+
+def _scan_dir(path: str) -> tuple[List[str], List[str]]:
+    """Split the entries of `path` into (subdirectory paths, other entry names).
+
+    Symlinks, including ones to directories, are not followed, as in rmtree.
+    """
+
+    subdirs: List[str] = []
+    names: List[str] = []
+    with os.scandir(path) as it:
+        for entry in it:
+            if entry.is_dir(follow_symlinks=False):
+                subdirs.append(entry.path)
+            else:
+                names.append(entry.name)
+    return subdirs, names
+
+
+def _unlink_batch(batch: tuple[str, List[str]]) -> None:
+    """Unlink the named entries of one directory, through a dir fd where supported."""
+
+    parent, names = batch
+    if not _UNLINK_AT:
+        for name in names:
+            os.unlink(os.path.join(parent, name))
+        return
+    fd = os.open(parent, os.O_RDONLY | getattr(os, "O_DIRECTORY", 0))
+    try:
+        for name in names:
+            os.unlink(name, dir_fd=fd)
+    finally:
+        os.close(fd)
+
+
+def _fast_rmtree(path: Path, workers: int) -> None:
+    """Remove the tree at `path`: all files first, then directories deepest first.
+
+    The tree is listed one level at a time, each level's directories scanned
+    concurrently; files are then unlinked in per-directory batches across
+    `workers` threads and the directories removed level by level from the
+    bottom up. Raises the first error hit, like shutil.rmtree, and likewise
+    refuses a symlink at `path` rather than emptying the directory it points to.
+    """
+
+    if os.path.islink(path):
+        raise OSError("Cannot call rmtree on a symbolic link")
+    if workers <= 1:
+        shutil.rmtree(path)
+        return
+
+    batches: List[tuple[str, List[str]]] = []
+    dirs_by_depth: List[List[str]] = []
+    with ThreadPoolExecutor(max_workers=workers) as ex:
+        level = [os.fspath(path)]
+        while level:
+            dirs_by_depth.append(level)
+            next_level: List[str] = []
+            for parent, (subdirs, names) in zip(level, ex.map(_scan_dir, level)):
+                next_level.extend(subdirs)
+                for i in range(0, len(names), _UNLINK_BATCH):
+                    batches.append((parent, names[i:i + _UNLINK_BATCH]))
+            level = next_level
+
+        for _ in ex.map(_unlink_batch, batches):
+            pass
+        for level in reversed(dirs_by_depth):
+            for _ in ex.map(os.rmdir, level):
+                pass
+
+
+def _delete_source_path(full_path: Path, workers: int = 1) -> tuple[bool, str | None]:
+    """Remove a source file or folder; returns (deleted, error message).
+
+    Folders are removed with `_fast_rmtree` using up to `workers` threads.
+    """
+
+    if not full_path.exists():
+        return False, None
+    try:
+        if full_path.is_dir():
+            _fast_rmtree(full_path, workers)
+        else:
+            full_path.unlink()
+        return True, None
+    except Exception as e:
+        return False, f"Failed to delete {full_path}: {e}"
+
+
 @dataclass
 class DeleteResult:
     """Result of a delete operation."""
@@ -225,15 +376,22 @@ def delete_nodes(
         )
         by_file.setdefault(src_file, []).append(nid)
 
-    # 5. Identify edges to remove (any edge touching a deleted node)
-    edges_to_remove: List[int] = []
-    for idx, e in enumerate(graph.edges):
-        if not isinstance(e, dict):
-            continue
-        from_id = e.get("from")
-        to_id = e.get("to")
-        if from_id in closure or to_id in closure:
-            edges_to_remove.append(idx)
+    # 5. Identify edges to remove (any edge touching a deleted node). Files that
+    # define such an edge are rewritten too, even if they lose no nodes, so no
+    # dangling edges are left behind in other model files.
+    touching = _build_edge_index(graph)["touching"]
+    edges_to_remove: Set[int] = {i for nid in closure for i in touching.get(nid, ())}
+    # Files defining at least one such edge; None if any edge's file is unknown
+    edge_files: Set[Path] | None = set()
+    for i in sorted(edges_to_remove):
+        prov = graph.provenance_by_edge_index.get(i)
+        if prov is not None:
+            edge_file = Path(prov.file).resolve()
+            by_file.setdefault(edge_file, [])
+            if edge_files is not None:
+                edge_files.add(edge_file)
+        else:
+            edge_files = None
 
     if dry_run:
         return DeleteResult(
@@ -258,20 +416,24 @@ def delete_nodes(
                 errors.append(f"Nodes is not a list in {model_file}")
                 continue
 
-            # Filter out deleted nodes
+            # Filter out deleted nodes (none in files listed only for their edges)
             ids_set = set(node_ids_to_remove)
             kept_nodes = [
                 n for n in nodes
                 if not (isinstance(n, dict) and n.get("id") in ids_set)
-            ]
-
-            # Filter out edges touching deleted nodes
-            kept_edges = [
-                e for e in edges
-                if not (isinstance(e, dict) and (
-                    e.get("from") in closure or e.get("to") in closure
-                ))
-            ]
+            ] if ids_set else nodes
+
+            # Filter out edges touching deleted nodes; the edge index already
+            # tells which files have any, so the others skip the per-edge tests
+            if edge_files is None or model_file in edge_files:
+                kept_edges = [
+                    e for e in edges
+                    if not (isinstance(e, dict) and (
+                        e.get("from") in closure or e.get("to") in closure
+                    ))
+                ]
+            else:
+                kept_edges = edges
 
             if len(kept_nodes) != len(nodes) or len(kept_edges) != len(edges):
                 model["nodes"] = kept_nodes
@@ -286,17 +448,19 @@ def delete_nodes(
     # 7. Delete source files/folders
     deleted_paths: List[str] = []
     if delete_source_files:
-        for nid, full_path in source_paths.items():
-            if not full_path.exists():
-                continue
-            try:
-                if full_path.is_dir():
-                    shutil.rmtree(full_path)
-                else:
-                    full_path.unlink()
+        paths = _outermost_paths(source_paths.values())
+        if len(paths) > 1:
+            # Folder trees share the thread budget with the other paths
+            tree_workers = max(1, _DELETE_WORKERS // len(paths))
+            with ThreadPoolExecutor(max_workers=min(_DELETE_WORKERS, len(paths))) as ex:
+                outcomes = list(ex.map(lambda p: _delete_source_path(p, tree_workers), paths))
+        else:
+            outcomes = [_delete_source_path(p, _DELETE_WORKERS) for p in paths]
+        for full_path, (deleted, error) in zip(paths, outcomes):
+            if deleted:
                 deleted_paths.append(str(full_path))
-            except Exception as e:
-                errors.append(f"Failed to delete {full_path}: {e}")
+            if error is not None:
+                errors.append(error)
 
     return DeleteResult(
         seed_node_id=seed_node_ids[0] if seed_node_ids else "",
@@ -10,17 +10,34 @@ Each channel has different guarantees and characteristics.
 
 from __future__ import annotations
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime
+from operator import attrgetter
 from typing import Optional, Any
 from pathlib import Path
-import json
+import os
 import uuid
 
+from .._json import dumpb, loads
 
-@dataclass
+
+# Message priorities in delivery order; unknown priorities rank as normal
+_PRIORITY_ORDER = {"emergency": 0, "urgent": 1, "normal": 2}
+
+
+def _iso_z(dt: Optional[datetime]) -> Optional[str]:
+    """`dt` (naive UTC) as ISO 8601 with a Z suffix; None stays None."""
+    return dt.isoformat() + "Z" if dt else None
+
+
+@dataclass(slots=True)
 class ChannelMessage:
-    """A message sent through a channel."""
+    """A message sent through a channel.
+
+    Slotted: channels can hold many pending messages, and no instance needs
+    a per-object __dict__.
+    """
 
     id: str
     from_entity: str
@@ -38,6 +55,12 @@ class ChannelMessage:
     acknowledged: bool = False
     acknowledged_at: Optional[datetime] = None
 
+    # Sort rank of `priority` (emergency first), derived at construction
+    priority_key: int = field(default=2, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.priority_key = _PRIORITY_ORDER.get(self.priority, 2)
+
     def to_dict(self) -> dict:
         return {
             "id": self.id,
@@ -48,11 +71,11 @@ class ChannelMessage:
             "priority": self.priority,
             "requires_ack": self.requires_ack,
             "created_at": self.created_at.isoformat() + "Z",
-            "expires_at": self.expires_at.isoformat() + "Z" if self.expires_at else None,
+            "expires_at": _iso_z(self.expires_at),
             "delivered": self.delivered,
-            "delivered_at": self.delivered_at.isoformat() + "Z" if self.delivered_at else None,
+            "delivered_at": _iso_z(self.delivered_at),
             "acknowledged": self.acknowledged,
-            "acknowledged_at": self.acknowledged_at.isoformat() + "Z" if self.acknowledged_at else None,
+            "acknowledged_at": _iso_z(self.acknowledged_at),
         }
 
     @classmethod
@@ -74,6 +97,22 @@ class ChannelMessage:
         )
 
 
+# Entity id characters replaced to form an inbox directory name
+_INBOX_TRANS = str.maketrans({":": "_", "/": "_"})
+
+# Upper bound on threads reading one inbox's message files
+_READ_WORKERS = 32
+
+
+def _read_bytes(path: str) -> Optional[bytes]:
+    """Contents of `path`, or None if it cannot be read."""
+    try:
+        with open(path, "rb") as f:
+            return f.read()
+    except OSError:
+        return None
+
+
 class Channel(ABC):
     """Abstract base for communication channels."""
 
@@ -111,30 +150,39 @@ class ModelChannel(Channel):
     def __init__(self, messages_dir: Path):
         self.messages_dir = messages_dir
         self.messages_dir.mkdir(parents=True, exist_ok=True)
+        # entity_id -> inbox directory, created on first use
+        self._inbox_cache: dict[str, Path] = {}
 
     def _inbox_path(self, entity_id: str) -> Path:
         """Get the inbox directory for an entity."""
-        # Sanitize entity_id for filesystem
-        safe_id = entity_id.replace(":", "_").replace("/", "_")
-        inbox = self.messages_dir / safe_id
-        inbox.mkdir(parents=True, exist_ok=True)
+        inbox = self._inbox_cache.get(entity_id)
+        if inbox is None:
+            # Sanitize entity_id for filesystem
+            inbox = self.messages_dir / entity_id.translate(_INBOX_TRANS)
+            inbox.mkdir(parents=True, exist_ok=True)
+            self._inbox_cache[entity_id] = inbox
         return inbox
 
     def send(self, message: ChannelMessage) -> bool:
         """Store message in recipient's inbox."""
+        # Mark as delivered up front, so the file is written once with its
+        # final delivery status (restored if the write fails)
+        previous = (message.delivered, message.delivered_at)
+        message.delivered = True
+        message.delivered_at = datetime.utcnow()
         try:
             inbox = self._inbox_path(message.to_entity)
             msg_file = inbox / f"{message.id}.json"
-            msg_file.write_text(json.dumps(message.to_dict(), indent=2), encoding="utf-8")
-
-            # Mark as delivered
-            message.delivered = True
-            message.delivered_at = datetime.utcnow()
-
-            # Update the file with delivery status
-            msg_file.write_text(json.dumps(message.to_dict(), indent=2), encoding="utf-8")
+            data = dumpb(message.to_dict())
+            try:
+                msg_file.write_bytes(data)
+            except FileNotFoundError:
+                # The cached inbox was removed behind our back; recreate it
+                inbox.mkdir(parents=True, exist_ok=True)
+                msg_file.write_bytes(data)
             return True
         except Exception:
+            message.delivered, message.delivered_at = previous
             return False
 
     def receive(self, entity_id: str) -> list[ChannelMessage]:
@@ -142,10 +190,28 @@ class ModelChannel(Channel):
         inbox = self._inbox_path(entity_id)
         messages = []
 
-        for msg_file in inbox.glob("*.json"):
+        # scandir yields names without building a Path per entry; normcase keeps
+        # the suffix match case-insensitive on Windows, as glob() was
+        try:
+            with os.scandir(inbox) as it:
+                msg_paths = [e.path for e in it if os.path.normcase(e.name).endswith(".json")]
+        except FileNotFoundError:
+            # Cached inbox removed since; nothing is pending
+            return messages
+
+        # Files are read concurrently (reads release the GIL, which matters on
+        # network or synced storage); parsing stays on this thread
+        if len(msg_paths) > 1:
+            with ThreadPoolExecutor(max_workers=min(_READ_WORKERS, len(msg_paths))) as ex:
+                blobs = list(ex.map(_read_bytes, msg_paths))
+        else:
+            blobs = [_read_bytes(p) for p in msg_paths]
+
+        for blob in blobs:
+            if blob is None:
+                continue
             try:
-                data = json.loads(msg_file.read_text(encoding="utf-8"))
-                msg = ChannelMessage.from_dict(data)
+                msg = ChannelMessage.from_dict(loads(blob))
 
                 # Only return unacknowledged messages that haven't expired
                 if not msg.acknowledged:
@@ -155,8 +221,7 @@ class ModelChannel(Channel):
                 continue
 
         # Sort by priority (emergency first) then by time
-        priority_order = {"emergency": 0, "urgent": 1, "normal": 2}
-        messages.sort(key=lambda m: (priority_order.get(m.priority, 2), m.created_at))
+        messages.sort(key=attrgetter("priority_key", "created_at"))
 
         return messages
 
@@ -169,10 +234,10 @@ class ModelChannel(Channel):
             return False
 
         try:
-            data = json.loads(msg_file.read_text(encoding="utf-8"))
+            data = loads(msg_file.read_bytes())
             data["acknowledged"] = True
             data["acknowledged_at"] = datetime.utcnow().isoformat() + "Z"
-            msg_file.write_text(json.dumps(data, indent=2), encoding="utf-8")
+            msg_file.write_bytes(dumpb(data))
             return True
         except Exception:
             return False
@@ -186,7 +251,7 @@ class ModelChannel(Channel):
             return None
 
         try:
-            data = json.loads(msg_file.read_text(encoding="utf-8"))
+            data = loads(msg_file.read_bytes())
             return ChannelMessage.from_dict(data)
         except Exception:
             return None
@@ -210,14 +275,20 @@ class WorkspaceChannel(Channel):
         """Queue message for workspace delivery."""
         # Use workspace_id from message metadata or parameter
         ws_id = workspace_id or message.to_entity
+        return self.send_many([message], ws_id) == 1
 
-        if ws_id not in self._queues:
-            self._queues[ws_id] = []
+    def send_many(self, messages: list[ChannelMessage], workspace_id: str) -> int:
+        """Queue several messages for one workspace in a single step.
 
-        message.delivered = True
-        message.delivered_at = datetime.utcnow()
-        self._queues[ws_id].append(message)
-        return True
+        All messages share one delivery timestamp. Returns the number queued.
+        """
+        queue = self._queues.setdefault(workspace_id, [])
+        now = datetime.utcnow()
+        for message in messages:
+            message.delivered = True
+            message.delivered_at = now
+        queue.extend(messages)
+        return len(messages)
 
     def receive(self, workspace_id: str) -> list[ChannelMessage]:
         """Get and clear pending messages for a workspace."""
@@ -1,10 +1,10 @@
 from __future__ import annotations
 
-import json
 import sqlite3
 from pathlib import Path
 from typing import Any, Dict, Optional
 
+from ._json import dumps
 from .loader import LoadedGraph, load_merged_model, load_merged_models
 
 
@@ -100,7 +100,7 @@ def index_graph(conn: sqlite3.Connection, graph: LoadedGraph) -> None:
                 node.get("type"),
                 node.get("label"),
                 node.get("description"),
-                json.dumps(node, ensure_ascii=False),
+                dumps(node),
                 prov.file,
             ),
         )
@@ -119,7 +119,7 @@ def index_graph(conn: sqlite3.Connection, graph: LoadedGraph) -> None:
                 edge.get("type"),
                 edge.get("from"),
                 edge.get("to"),
-                json.dumps(edge, ensure_ascii=False),
+                dumps(edge),
                 prov.file,
             ),
         )
@@ -128,10 +128,17 @@ def index_graph(conn: sqlite3.Connection, graph: LoadedGraph) -> None:
 def rebuild_index(
     root_model_path: Path,
     db_path: Path = DEFAULT_DB_PATH,
+    *,
+    graph: Optional[LoadedGraph] = None,
 ) -> Path:
-    """Rebuild the derived SQLite index from the canonical JSON model."""
+    """Rebuild the derived SQLite index from the canonical JSON model.
 
-    graph = load_merged_model(root_model_path)
+    Pass `graph` if the caller already holds the merged graph of
+    `root_model_path`; the model files are then not parsed again.
+    """
+
+    if graph is None:
+        graph = load_merged_model(root_model_path)
     with open_db(db_path) as conn:
         index_graph(conn, graph)
         conn.commit()
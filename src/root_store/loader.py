@@ -1,9 +1,11 @@
 from __future__ import annotations
 
-import json
+from collections import deque
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, Iterable, List
+from typing import Any, Deque, Dict, Iterable, List, Optional
+
+from ._json import loads
 
 
 @dataclass(frozen=True)
@@ -20,7 +22,7 @@ class LoadedGraph:
 
 
 def _read_json(path: Path) -> Dict[str, Any]:
-    return json.loads(path.read_text(encoding="utf-8"))
+    return loads(path.read_bytes())
 
 
 def _normalize_ref_path(ref: str) -> Path:
@@ -37,25 +39,27 @@ def _discover_model_refs(model: Dict[str, Any]) -> Iterable[str]:
             yield mm["_ref"]
 
 
-def discover_model_files(root_model_paths: List[Path]) -> List[Path]:
-    """Discover all model files reachable from one or more root entry models.
+def _discover_models(root_model_paths: List[Path]) -> Dict[Path, Optional[Dict[str, Any]]]:
+    """Parse every model file reachable from the roots, following `_ref` links.
 
-    This follows nested `_ref` links recursively.
+    Maps each file to its parsed model, or None if it could not be read, so
+    loading can reuse what discovery already parsed.
     """
 
-    queue: List[Path] = [p.resolve() for p in root_model_paths]
-    seen: set[Path] = set()
+    queue: Deque[Path] = deque(p.resolve() for p in root_model_paths)
+    seen: Dict[Path, Optional[Dict[str, Any]]] = {}
 
     while queue:
-        p = queue.pop(0).resolve()
+        p = queue.popleft().resolve()
         if p in seen:
             continue
-        seen.add(p)
+        seen[p] = None
 
         try:
             model = _read_json(p)
         except Exception:
             continue
+        seen[p] = model
 
         base_dir = p.parent.parent
         for ref in _discover_model_refs(model):
@@ -65,7 +69,16 @@ def discover_model_files(root_model_paths: List[Path]) -> List[Path]:
             if ref_path.exists() and ref_path not in seen:
                 queue.append(ref_path)
 
-    return sorted(seen)
+    return seen
+
+
+def discover_model_files(root_model_paths: List[Path]) -> List[Path]:
+    """Discover all model files reachable from one or more root entry models.
+
+    This follows nested `_ref` links recursively.
+    """
+
+    return sorted(_discover_models(root_model_paths))
 
 
 def load_merged_models(root_model_paths: List[Path]) -> LoadedGraph:
@@ -75,7 +88,7 @@ def load_merged_models(root_model_paths: List[Path]) -> LoadedGraph:
     """
 
     roots = [p.resolve() for p in root_model_paths]
-    files = discover_model_files(roots)
+    models = _discover_models(roots)
 
     nodes: Dict[str, Dict[str, Any]] = {}
     edges: List[Dict[str, Any]] = []
@@ -83,20 +96,23 @@ def load_merged_models(root_model_paths: List[Path]) -> LoadedGraph:
     prov_edges: Dict[int, Provenance] = {}
 
     def ingest(model: Dict[str, Any], file_path: Path) -> None:
-        file_str = file_path.as_posix()
+        # Provenance is frozen, so one instance serves every entry of the file
+        prov = Provenance(file=file_path.as_posix())
         for n in model.get("nodes", []):
             nid = n.get("id")
             if isinstance(nid, str) and nid not in nodes:
                 nodes[nid] = n
-                prov_nodes[nid] = Provenance(file=file_str)
+                prov_nodes[nid] = prov
         start = len(edges)
         edges.extend(model.get("edges", []))
-        for idx in range(start, len(edges)):
-            prov_edges[idx] = Provenance(file=file_str)
+        prov_edges.update(dict.fromkeys(range(start, len(edges)), prov))
 
-    for f in files:
+    for f in sorted(models):
+        model = models[f]
+        if model is None:
+            continue
         try:
-            ingest(_read_json(f), f)
+            ingest(model, f)
         except Exception:
             continue
 
@@ -21,10 +21,14 @@ def _pick_label(n: Dict[str, Any]) -> str:
     return _safe_str(n.get("label") or n.get("id") or "(unknown)")
 
 
-def _iter_nodes_by_type(nodes: Dict[str, Dict[str, Any]], node_type: str) -> Iterable[Dict[str, Any]]:
+def _group_nodes_by_type(nodes: Dict[str, Dict[str, Any]], node_types: Iterable[str]) -> Dict[str, List[Dict[str, Any]]]:
+    """Nodes of each of `node_types`, in graph order, from a single pass over `nodes`."""
+    by_type: Dict[str, List[Dict[str, Any]]] = {t: [] for t in node_types}
     for n in nodes.values():
-        if n.get("type") == node_type:
-            yield n
+        t = n.get("type")
+        if isinstance(t, str) and t in by_type:
+            by_type[t].append(n)
+    return by_type
 
 
 def _status_bucket(status: str) -> str:
@@ -53,10 +57,12 @@ def render_human_state(config: HumanStateConfig) -> str:
     root = nodes.get("reality-seed", {})
     title = _pick_label(root) or "Root"
 
+    by_type = _group_nodes_by_type(nodes, ("Reality", "Audit", "Gap"))
+
     # --- Realities overview (top-level, from root file) ---
     root_file = str(root_model_path.as_posix())
     top_realities: List[Dict[str, Any]] = []
-    for n in _iter_nodes_by_type(nodes, "Reality"):
+    for n in by_type["Reality"]:
         nid = n.get("id")
         if not isinstance(nid, str):
             continue
@@ -73,7 +79,7 @@ def render_human_state(config: HumanStateConfig) -> str:
 
     # --- What's failing right now ---
     failing_audits: List[Dict[str, Any]] = []
-    for a in _iter_nodes_by_type(nodes, "Audit"):
+    for a in by_type["Audit"]:
         if _status_bucket(_safe_str(a.get("status"))) == "bad":
             failing_audits.append(a)
 
@@ -107,7 +113,7 @@ def render_human_state(config: HumanStateConfig) -> str:
 
     # --- High priority gaps (human phrasing) ---
     gaps: List[Dict[str, Any]] = []
-    for g in _iter_nodes_by_type(nodes, "Gap"):
+    for g in by_type["Gap"]:
         pr = _safe_str(g.get("priority") or "").lower()
         if pr in {"critical", "high"}:
             gaps.append(g)
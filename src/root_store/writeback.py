@@ -1,17 +1,18 @@
 from __future__ import annotations
 
 from collections import defaultdict
-import json
 from pathlib import Path
 from typing import Any, Callable, Dict, Mapping
 
+from ._json import dumps, loads
+
 
 def read_json(path: Path) -> Dict[str, Any]:
-    return json.loads(path.read_text(encoding="utf-8"))
+    return loads(path.read_bytes())
 
 
 def write_json(path: Path, data: Dict[str, Any]) -> None:
-    path.write_text(json.dumps(data, indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
+    path.write_text(dumps(data, indent=True) + "\n", encoding="utf-8")
 
 
 def update_node_in_file(*, model_file: Path, node_id: str, update: Callable[[Dict[str, Any]], None]) -> bool:
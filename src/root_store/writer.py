@@ -1,20 +1,20 @@
 from __future__ import annotations
 
-import json
 from pathlib import Path
 from typing import Any, Dict
 
+from ._json import dumps, loads
 from .enforcement import validate_change_gate
 from .loader import load_merged_model
 from .writeback import apply_node_updates
 
 
 def _read_json(path: Path) -> Dict[str, Any]:
-    return json.loads(path.read_text(encoding="utf-8"))
+    return loads(path.read_bytes())
 
 
 def _write_json(path: Path, data: Dict[str, Any]) -> None:
-    path.write_text(json.dumps(data, indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
+    path.write_text(dumps(data, indent=True) + "\n", encoding="utf-8")
 
 
 def apply_change(root_model_path: Path, change_id: str) -> None:
@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+from root_store import audits
+
+
+def test_sha256_cached_reuses_entry_while_stat_unchanged(tmp_path: Path, monkeypatch) -> None:
+    f = tmp_path / "module.py"
+    f.write_text("print('hi')\n", encoding="utf-8")
+    expected = audits._sha256(f)
+
+    calls: list[Path] = []
+    real_sha256 = audits._sha256
+
+    def counting_sha256(path: Path) -> str:
+        calls.append(path)
+        return real_sha256(path)
+
+    monkeypatch.setattr(audits, "_sha256", counting_sha256)
+
+    fresh: dict = {}
+    assert audits._sha256_cached(f, {}, fresh) == expected
+    assert len(calls) == 1
+
+    cache, fresh = fresh, {}
+    assert audits._sha256_cached(f, cache, fresh) == expected
+    assert len(calls) == 1
+    assert fresh == cache
+
+    # Same size, new mtime: the file is hashed again.
+    f.write_text("print('ho')\n", encoding="utf-8")
+    st = f.stat()
+    os.utime(f, ns=(st.st_atime_ns, cache[str(f)]["mtime_ns"] + 1_000_000_000))
+    assert audits._sha256_cached(f, cache, {}) == real_sha256(f) != expected
+    assert len(calls) == 2
+
+
+def test_sha256_cache_round_trips_through_disk(tmp_path: Path) -> None:
+    f = tmp_path / "module.py"
+    f.write_text("x = 1\n", encoding="utf-8")
+    cache_path = tmp_path / "hash_cache.json"
+
+    fresh: dict = {}
+    audits._sha256_cached(f, audits._load_sha256_cache(cache_path), fresh)
+    audits._save_sha256_cache(cache_path, fresh)
+
+    assert audits._load_sha256_cache(cache_path) == fresh
+    assert not cache_path.with_suffix(".json.tmp").exists()
+
+
+def test_sha256_cache_merge_keeps_other_roots_and_drops_missing_files(tmp_path: Path) -> None:
+    other_root = tmp_path / "other" / "module.py"
+    other_root.parent.mkdir()
+    other_root.write_text("y = 2\n", encoding="utf-8")
+    this_root = tmp_path / "this.py"
+    this_root.write_text("x = 1\n", encoding="utf-8")
+
+    cache: dict = {}
+    audits._sha256_cached(other_root, {}, cache)
+    audits._sha256_cached(this_root, {}, cache)
+    cache[str(tmp_path / "gone.py")] = {"mtime_ns": 0, "size": 0, "sha256": "0"}
+
+    fresh: dict = {}
+    audits._sha256_cached(this_root, cache, fresh)
+    merged = audits._merge_sha256_cache(cache, fresh)
+
+    assert set(merged) == {str(other_root), str(this_root)}
+    assert merged[str(this_root)] == fresh[str(this_root)]
+
+
+def test_nested_audits_share_one_graph_and_timestamp(monkeypatch) -> None:
+    loads: list[Path] = []
+    monkeypatch.setattr(audits, "load_merged_model", lambda p: loads.append(p) or object())
+
+    seen: list[tuple[object, str]] = []
+
+    @audits._audit_scoped
+    def inner(path: Path) -> dict:
+        seen.append((audits._load_merged(path), audits._audit_now()))
+        return {}
+
+    @audits._audit_scoped
+    def outer(path: Path) -> dict:
+        seen.append((audits._load_merged(path), audits._audit_now()))
+        inner(path)
+        return {}
+
+    outer(Path("model/sketch.json"))
+    assert len(loads) == 1
+    assert seen[0] == seen[1]
+
+    # The scope closes with the outermost audit; the next run loads again.
+    outer(Path("model/sketch.json"))
+    assert len(loads) == 2
+
+
+def test_prune_for_scream_elides_only_large_evidence() -> None:
+    small = {"id": "check-a", "evidence": {"ok": True}}
+    assert audits._prune_for_scream(small) is small
+    assert audits._prune_for_scream(None) is None
+
+    big = {"id": "audit-a", "status": "fail", "evidence": {"results": "x" * 5000, "scream": {}}}
+    pruned = audits._prune_for_scream(big)
+    assert pruned["id"] == "audit-a" and pruned["status"] == "fail"
+    assert pruned["evidence"]["_elided"] is True
+    assert pruned["evidence"]["keys"] == ["results", "scream"]
+    assert pruned["evidence"]["bytes"] > audits._SCREAM_EVIDENCE_MAX_BYTES
+    assert big["evidence"]["results"] == "x" * 5000
+
+
+def test_scan_parent_dirs_lists_each_directory_once(tmp_path: Path) -> None:
+    (tmp_path / "a.py").write_text("a", encoding="utf-8")
+    (tmp_path / "b.py").write_text("bb", encoding="utf-8")
+    paths = [str(tmp_path / "a.py"), str(tmp_path / "b.py"), str(tmp_path / "gone" / "c.py")]
+
+    scanned = audits._scan_parent_dirs(paths)
+
+    assert set(scanned) == {str(tmp_path), str(tmp_path / "gone")}
+    assert scanned[str(tmp_path)]["b.py"].stat().st_size == 2
+    assert scanned[str(tmp_path / "gone")] == {}
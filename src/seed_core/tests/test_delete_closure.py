@@ -0,0 +1,190 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+from root_store.delete import compute_delete_closure, delete_nodes
+from root_store.loader import load_merged_model
+
+
+def _write_json(path: Path, data: dict) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(data, indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
+
+
+def _read_json(path: Path) -> dict:
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def _write_model(root_model: Path) -> None:
+    _write_json(
+        root_model,
+        {
+            "schema_version": "3.0",
+            "nodes": [
+                {"id": "reality-a", "type": "Reality"},
+                {"id": "subsystem-b", "type": "Subsystem"},
+                {"id": "module-c", "type": "Module"},
+                {"id": "audit-1", "type": "Audit"},
+                {"id": "check-1", "type": "Check"},
+                {"id": "other", "type": "Module"},
+            ],
+            "edges": [
+                {"type": "CONTAINS", "from": "reality-a", "to": "subsystem-b"},
+                {"type": "CONTAINS", "from": "subsystem-b", "to": "module-c"},
+                {"type": "CONTAINS", "from": "subsystem-b", "to": "audit-1"},
+                {"type": "HAS_CHECK", "from": "audit-1", "to": "check-1"},
+                {"type": "DEPENDS_ON", "from": "other", "to": "module-c"},
+                {"type": "DEPENDS_ON", "from": "other", "to": "reality-a"},
+            ],
+        },
+    )
+
+
+def test_compute_delete_closure_follows_contains_and_has_check(tmp_path: Path) -> None:
+    root_model = tmp_path / "base" / "model" / "sketch.json"
+    _write_model(root_model)
+
+    g = load_merged_model(root_model)
+
+    assert compute_delete_closure(g, ["subsystem-b"]) == {"subsystem-b", "module-c", "audit-1", "check-1"}
+    assert compute_delete_closure(g, ["check-1"]) == {"audit-1", "check-1"}
+    assert compute_delete_closure(g, ["other"]) == {"other"}
+
+
+def test_delete_nodes_removes_closure_and_touching_edges(tmp_path: Path) -> None:
+    root_model = tmp_path / "base" / "model" / "sketch.json"
+    _write_model(root_model)
+
+    dry = delete_nodes(root_model_path=root_model, seed_node_ids=["subsystem-b"], dry_run=True)
+    assert dry.ok
+    assert dry.removed_edge_count == 5
+
+    result = delete_nodes(root_model_path=root_model, seed_node_ids=["subsystem-b"])
+    assert result.ok
+    assert result.deleted_node_ids == ["audit-1", "check-1", "module-c", "subsystem-b"]
+
+    after = _read_json(root_model)
+    assert [n["id"] for n in after["nodes"]] == ["reality-a", "other"]
+    assert after["edges"] == [{"type": "DEPENDS_ON", "from": "other", "to": "reality-a"}]
+
+
+def test_delete_nodes_removes_edges_defined_in_other_files(tmp_path: Path) -> None:
+    base = tmp_path / "base"
+    root_model = base / "model" / "sketch.json"
+    sub_model = base / "sub" / "model" / "sketch.json"
+
+    _write_json(
+        root_model,
+        {
+            "schema_version": "3.0",
+            "nodes": [
+                {
+                    "id": "mount-sub",
+                    "type": "Subsystem",
+                    "model": {"_ref": "sub/model/sketch.json"},
+                }
+            ],
+            "edges": [
+                {"type": "HAS_CHECK", "from": "audit-1", "to": "check-1"},
+            ],
+        },
+    )
+    _write_json(
+        sub_model,
+        {
+            "schema_version": "3.0",
+            "nodes": [
+                {"id": "audit-1", "type": "Audit"},
+                {"id": "check-1", "type": "Check"},
+            ],
+            "edges": [],
+        },
+    )
+
+    result = delete_nodes(root_model_path=root_model, seed_node_ids=["check-1"])
+
+    assert result.ok
+    assert result.removed_edge_count == 1
+    assert _read_json(root_model)["edges"] == []
+    assert [n["id"] for n in _read_json(root_model)["nodes"]] == ["mount-sub"]
+    assert _read_json(sub_model)["nodes"] == []
+
+
+def test_delete_nodes_removes_nested_and_sibling_sources(tmp_path: Path) -> None:
+    base = tmp_path / "base"
+    root_model = base / "model" / "sketch.json"
+    (base / "pkg" / "sub").mkdir(parents=True)
+    (base / "pkg" / "sub" / "mod.py").write_text("x = 1\n", encoding="utf-8")
+    (base / "tool.py").write_text("y = 2\n", encoding="utf-8")
+
+    _write_json(
+        root_model,
+        {
+            "schema_version": "3.0",
+            "nodes": [
+                {"id": "reality-a", "type": "Reality"},
+                {"id": "subsystem-pkg", "type": "Subsystem", "source": {"path": "pkg"}},
+                {"id": "module-mod", "type": "Module", "source": {"path": "pkg/sub/mod.py"}},
+                {"id": "module-tool", "type": "Module", "source": {"path": "tool.py"}},
+            ],
+            "edges": [
+                {"type": "CONTAINS", "from": "reality-a", "to": "subsystem-pkg"},
+                {"type": "CONTAINS", "from": "subsystem-pkg", "to": "module-mod"},
+                {"type": "CONTAINS", "from": "reality-a", "to": "module-tool"},
+            ],
+        },
+    )
+
+    result = delete_nodes(root_model_path=root_model, seed_node_ids=["reality-a"])
+
+    assert result.ok, result.errors
+    assert sorted(Path(p).name for p in result.deleted_source_paths) == ["pkg", "tool.py"]
+    assert not (base / "pkg").exists()
+    assert not (base / "tool.py").exists()
+
+
+def test_fast_rmtree_removes_tree_without_following_symlinks(tmp_path: Path) -> None:
+    from root_store.delete import _fast_rmtree
+
+    outside = tmp_path / "outside"
+    outside.mkdir()
+    (outside / "keep.txt").write_text("keep", encoding="utf-8")
+
+    tree = tmp_path / "tree"
+    for d in ("a/b/c", "a/d", "e"):
+        (tree / d).mkdir(parents=True)
+    for f in ("top.txt", "a/1.txt", "a/b/2.txt", "a/b/c/3.txt", "e/4.txt"):
+        (tree / f).write_text(f, encoding="utf-8")
+    (tree / "a" / "link").symlink_to(outside, target_is_directory=True)
+
+    _fast_rmtree(tree, workers=4)
+
+    assert not tree.exists()
+    assert (outside / "keep.txt").read_text(encoding="utf-8") == "keep"
+
+
+def test_delete_nodes_refuses_symlinked_source_folder(tmp_path: Path) -> None:
+    base = tmp_path / "base"
+    root_model = base / "model" / "sketch.json"
+    target = tmp_path / "outside"
+    (target / "sub").mkdir(parents=True)
+    (target / "a").write_text("a", encoding="utf-8")
+    (target / "sub" / "b").write_text("b", encoding="utf-8")
+    base.mkdir()
+    (base / "linked").symlink_to(target, target_is_directory=True)
+
+    _write_json(
+        root_model,
+        {
+            "schema_version": "3.0",
+            "nodes": [{"id": "module-linked", "type": "Module", "source": {"path": "linked"}}],
+            "edges": [],
+        },
+    )
+
+    result = delete_nodes(root_model_path=root_model, seed_node_ids=["module-linked"])
+
+    assert any("symbolic link" in e for e in result.errors)
+    assert (target / "a").read_text(encoding="utf-8") == "a"
+    assert (target / "sub" / "b").read_text(encoding="utf-8") == "b"
@@ -82,3 +82,13 @@ def test_save_exec_fallback_when_no_save(tmp_path: Path) -> None:
     assert "save_exec" in updated_node["evidence"]
     assert "last_run" in updated_node["evidence"]["save_exec"]
     assert updated_node["evidence"]["save_exec"]["last_run"]["used_fallback"] is True
+
+
+def test_package_save_exec_is_the_function_after_submodule_import() -> None:
+    import root_store
+    import root_store.save_exec  # noqa: F401  (binds the submodule on first import)
+    from root_store import save_exec as exported
+
+    assert exported is save_exec
+    assert root_store.save_exec is save_exec
+    assert sys.modules["root_store.save_exec"].save_exec is save_exec
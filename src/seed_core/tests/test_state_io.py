@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+STATE_DIR = Path(__file__).resolve().parents[3] / ".state"
+if str(STATE_DIR) not in sys.path:
+    sys.path.insert(0, str(STATE_DIR))
+
+import state_io  # noqa: E402
+
+
+def test_write_model_bytes_replaces_without_leaving_temp(tmp_path: Path) -> None:
+    model = tmp_path / "sketch.json"
+    model.write_bytes(b"old")
+
+    state_io.write_model_bytes(model, b"new")
+
+    assert model.read_bytes() == b"new"
+    assert [p.name for p in tmp_path.iterdir()] == ["sketch.json"]
+
+
+def _write_model(path: Path, node_id: str) -> None:
+    path.write_text(json.dumps({"nodes": [{"id": node_id}], "edges": []}), encoding="utf-8")
+
+
+def test_state_server_picks_up_outside_writes_when_idle(tmp_path: Path) -> None:
+    import state_server
+
+    model = tmp_path / "sketch.json"
+    _write_model(model, "a")
+    server = state_server.StateServer(str(model))
+
+    _write_model(model, "b")
+    server.handle({"op": "add_mode", "target": "b", "name": "m", "payload": {}})
+    server.flush()
+
+    assert json.loads(model.read_text(encoding="utf-8"))["nodes"] == [{"id": "b", "modes": {"m": {}}}]
+
+
+def test_state_server_refuses_to_overwrite_outside_writes(tmp_path: Path) -> None:
+    import state_server
+
+    model = tmp_path / "sketch.json"
+    _write_model(model, "a")
+    server = state_server.StateServer(str(model))
+    server.handle({"op": "add_mode", "target": "a", "name": "m", "payload": {}})
+
+    _write_model(model, "b")
+    with pytest.raises(state_server.ModelChangedError):
+        server.flush()
+
+    assert json.loads(model.read_text(encoding="utf-8"))["nodes"] == [{"id": "b"}]
+    assert server.model["nodes"] == [{"id": "b"}]